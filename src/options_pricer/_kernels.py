@@ -0,0 +1,58 @@
+"""Compiled numerical kernels, with pure-NumPy fallbacks when numba is absent.
+
+numba is imported on a kernel's first call rather than at import: importing
+it costs hundreds of milliseconds, and the dashboard imports models (and so
+this module) without ever evaluating a payoff grid.
+"""
+
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def _payoff_grid_numpy(spots, strikes, signs, is_call, out):
+    """payoff_grid as one (spots x legs) NumPy broadcast."""
+    # (spots x legs) grid: spot - strike for calls, strike - spot for puts
+    moneyness = spots[:, None] - strikes
+    np.matmul(np.maximum(np.where(is_call, moneyness, -moneyness), 0.0), signs, out=out)
+    return out
+
+
+def _payoff_grid_loops(spots, strikes, signs, is_call, out):
+    """payoff_grid as one fused loop -- no temporary arrays once compiled."""
+    for i in range(spots.shape[0]):
+        sp = spots[i]
+        total = 0.0
+        for j in range(strikes.shape[0]):
+            x = sp - strikes[j] if is_call[j] else strikes[j] - sp
+            if x > 0.0:
+                total += signs[j] * x
+        out[i] = total
+    return out
+
+
+def _build_payoff_grid():
+    """Compile the fused kernel, or fall back to the NumPy one."""
+    try:
+        from numba import njit
+    except ImportError:
+        logger.info("numba not installed — using NumPy payoff kernels")
+        return _payoff_grid_numpy
+    # cache=True keeps the compiled kernel on disk, so the JIT cost is paid once
+    return njit(cache=True)(_payoff_grid_loops)
+
+
+_payoff_grid_impl = None
+
+
+def payoff_grid(spots, strikes, signs, is_call, out):
+    """Expiry payoff of every leg at every spot, summed per spot into ``out``.
+
+    spots, strikes and signs are float64, is_call is bool; returns ``out``.
+    """
+    global _payoff_grid_impl
+    if _payoff_grid_impl is None:
+        _payoff_grid_impl = _build_payoff_grid()
+    return _payoff_grid_impl(spots, strikes, signs, is_call, out)
@@ -37,6 +37,41 @@ class OptionQuote:
     offer_size: int = 0
 
 
+_QUOTE_FIELDS = ("BID", "ASK", "BID_SIZE", "ASK_SIZE")
+
+
+def _option_ticker(underlying: str, expiry: date, strike: float, option_type: str) -> str:
+    """Build a Bloomberg option ticker.
+
+    Format: "AAPL 06/16/26 C300 Equity" for AAPL Jun26 300 Call
+    """
+    exp_str = expiry.strftime("%m/%d/%y")
+    type_char = "C" if option_type == "call" else "P"
+    return f"{underlying} {exp_str} {type_char}{strike:.0f} Equity"
+
+
+def _read_quote(fd, ticker: str) -> OptionQuote:
+    """Read BID/ASK/BID_SIZE/ASK_SIZE from a fieldData element."""
+    quote = OptionQuote()
+    try:
+        quote.bid = fd.getElementAsFloat("BID")
+    except Exception:
+        logger.debug("BID field missing for %s", ticker)
+    try:
+        quote.offer = fd.getElementAsFloat("ASK")
+    except Exception:
+        logger.debug("ASK field missing for %s", ticker)
+    try:
+        quote.bid_size = int(fd.getElementAsFloat("BID_SIZE"))
+    except Exception:
+        logger.debug("BID_SIZE field missing for %s", ticker)
+    try:
+        quote.offer_size = int(fd.getElementAsFloat("ASK_SIZE"))
+    except Exception:
+        logger.debug("ASK_SIZE field missing for %s", ticker)
+    return quote
+
+
 class BloombergClient:
     """Wrapper around blpapi for fetching live market data."""
 
@@ -44,6 +79,8 @@ class BloombergClient:
         self._host = host
         self._port = port
         self._session = None
+        # OPT_CONT_SIZE is static reference data — fetch once per underlying
+        self._multipliers: dict[str, int] = {}
 
     def connect(self) -> bool:
         try:
@@ -100,19 +137,13 @@ class BloombergClient:
         try:
             import blpapi
 
-            # Build Bloomberg option ticker
-            # Format: "AAPL 06/16/26 C300 Equity" for AAPL Jun26 300 Call
-            exp_str = expiry.strftime("%m/%d/%y")
-            type_char = "C" if option_type == "call" else "P"
-            ticker = f"{underlying} {exp_str} {type_char}{strike:.0f} Equity"
+            ticker = _option_ticker(underlying, expiry, strike, option_type)
 
             refdata = self._session.getService("//blp/refdata")
             request = refdata.createRequest("ReferenceDataRequest")
             request.append("securities", ticker)
-            request.append("fields", "BID")
-            request.append("fields", "ASK")
-            request.append("fields", "BID_SIZE")
-            request.append("fields", "ASK_SIZE")
+            for fld in _QUOTE_FIELDS:
+                request.append("fields", fld)
             self._session.sendRequest(request)
 
             quote = OptionQuote()
@@ -121,23 +152,7 @@ class BloombergClient:
                 for msg in event:
                     if msg.hasElement("securityData"):
                         sec_data = msg.getElement("securityData").getValueAsElement(0)
-                        fd = sec_data.getElement("fieldData")
-                        try:
-                            quote.bid = fd.getElementAsFloat("BID")
-                        except Exception:
-                            logger.debug("BID field missing for %s", ticker)
-                        try:
-                            quote.offer = fd.getElementAsFloat("ASK")
-                        except Exception:
-                            logger.debug("ASK field missing for %s", ticker)
-                        try:
-                            quote.bid_size = int(fd.getElementAsFloat("BID_SIZE"))
-                        except Exception:
-                            logger.debug("BID_SIZE field missing for %s", ticker)
-                        try:
-                            quote.offer_size = int(fd.getElementAsFloat("ASK_SIZE"))
-                        except Exception:
-                            logger.debug("ASK_SIZE field missing for %s", ticker)
+                        quote = _read_quote(sec_data.getElement("fieldData"), ticker)
                 if event.eventType() == blpapi.Event.RESPONSE:
                     break
             return quote
@@ -145,6 +160,62 @@ class BloombergClient:
             logger.warning("Failed to fetch option quote for %s", underlying, exc_info=True)
             return OptionQuote()
 
+    def get_structure_quotes(
+        self, underlying: str, legs: list[tuple[date, float, str]],
+    ) -> tuple[float | None, list[OptionQuote], int]:
+        """Fetch spot, per-leg quotes and contract multiplier in one request.
+
+        The underlying and every option ticker go out as a single
+        ReferenceDataRequest, so a structure costs one round-trip to the
+        Terminal regardless of leg count. Legs are (expiry, strike, option_type).
+
+        Returns (spot, quotes, multiplier) with quotes in leg order.
+        """
+        if not self._session:
+            return None, [OptionQuote() for _ in legs], 100
+
+        equity = f"{underlying} US Equity"
+        tickers = [_option_ticker(underlying, *leg) for leg in legs]
+        spot = None
+        multiplier = self._multipliers.get(underlying, 100)
+        quotes_by_ticker: dict[str, OptionQuote] = {}
+        try:
+            import blpapi
+
+            refdata = self._session.getService("//blp/refdata")
+            request = refdata.createRequest("ReferenceDataRequest")
+            for security in dict.fromkeys([equity, *tickers]):
+                request.append("securities", security)
+            for fld in ("PX_LAST", "OPT_CONT_SIZE", *_QUOTE_FIELDS):
+                request.append("fields", fld)
+            self._session.sendRequest(request)
+
+            while True:
+                event = self._session.nextEvent(500)
+                for msg in event:
+                    if not msg.hasElement("securityData"):
+                        continue
+                    sec_array = msg.getElement("securityData")
+                    for j in range(sec_array.numValues()):
+                        sec_data = sec_array.getValueAsElement(j)
+                        security = sec_data.getElementAsString("security")
+                        fd = sec_data.getElement("fieldData")
+                        if security == equity:
+                            if fd.hasElement("PX_LAST"):
+                                spot = fd.getElementAsFloat("PX_LAST")
+                            if fd.hasElement("OPT_CONT_SIZE"):
+                                multiplier = int(fd.getElementAsFloat("OPT_CONT_SIZE"))
+                                self._multipliers[underlying] = multiplier
+                        else:
+                            quotes_by_ticker[security] = _read_quote(fd, security)
+                if event.eventType() == blpapi.Event.RESPONSE:
+                    break
+        except Exception:
+            logger.warning("Failed to fetch structure quotes for %s", underlying, exc_info=True)
+
+        quotes = [quotes_by_ticker.get(t) or OptionQuote() for t in tickers]
+        return spot, quotes, multiplier
+
     def get_implied_vol(
         self, underlying: str, expiry: date, strike: float,
     ) -> float | None:
@@ -161,6 +232,9 @@ class BloombergClient:
         """Fetch OPT_CONT_SIZE from Bloomberg for the underlying's options."""
         if not self._session:
             return 100
+        cached = self._multipliers.get(underlying)
+        if cached is not None:
+            return cached
         try:
             import blpapi
 
@@ -176,7 +250,9 @@ class BloombergClient:
                     if msg.hasElement("securityData"):
                         sec_data = msg.getElement("securityData").getValueAsElement(0)
                         field_data = sec_data.getElement("fieldData")
-                        return int(field_data.getElementAsFloat("OPT_CONT_SIZE"))
+                        mult = int(field_data.getElementAsFloat("OPT_CONT_SIZE"))
+                        self._multipliers[underlying] = mult
+                        return mult
                 if event.eventType() == blpapi.Event.RESPONSE:
                     break
         except Exception:
@@ -281,6 +357,13 @@ class MockBloombergClient:
             offer_size=offer_size,
         )
 
+    def get_structure_quotes(
+        self, underlying: str, legs: list[tuple[date, float, str]],
+    ) -> tuple[float, list[OptionQuote], int]:
+        """Return (spot, quotes, multiplier) — mirrors BloombergClient."""
+        quotes = [self.get_option_quote(underlying, *leg) for leg in legs]
+        return self.get_spot(underlying), quotes, self.get_contract_multiplier(underlying)
+
     def get_implied_vol(
         self, underlying: str, expiry: date, strike: float,
     ) -> float:
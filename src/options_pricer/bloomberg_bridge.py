@@ -92,9 +92,10 @@ def option_quotes():
         return jsonify({"error": "Missing 'underlying' and 'legs' in request body"}), 400
 
     underlying = data["underlying"].upper()
-    spot_price = _client.get_spot(underlying)
 
-    quotes = []
+    # Validate legs first so all good ones go to Bloomberg in one request
+    batch_legs = []
+    batch_index: list[int | None] = []
     for leg in data["legs"]:
         expiry_str = leg.get("expiry", "")
         strike = float(leg.get("strike", 0))
@@ -104,12 +105,20 @@ def option_quotes():
         try:
             expiry = datetime.strptime(expiry_str, "%Y-%m-%d").date()
         except (ValueError, TypeError):
-            quotes.append({"bid": 0, "bid_size": 0, "offer": 0, "offer_size": 0})
+            batch_index.append(None)
             continue
 
-        quote: OptionQuote = _client.get_option_quote(
-            underlying, expiry, strike, option_type,
-        )
+        batch_index.append(len(batch_legs))
+        batch_legs.append((expiry, strike, option_type))
+
+    spot_price, batch_quotes, mult = _client.get_structure_quotes(underlying, batch_legs)
+
+    quotes = []
+    for idx in batch_index:
+        if idx is None:
+            quotes.append({"bid": 0, "bid_size": 0, "offer": 0, "offer_size": 0})
+            continue
+        quote: OptionQuote = batch_quotes[idx]
         quotes.append({
             "bid": quote.bid,
             "bid_size": quote.bid_size,
@@ -117,7 +126,6 @@ def option_quotes():
             "offer_size": quote.offer_size,
         })
 
-    mult = _client.get_contract_multiplier(underlying)
     return jsonify({"spot": spot_price, "quotes": quotes, "multiplier": mult})
 
 
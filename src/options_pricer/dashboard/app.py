@@ -7,19 +7,25 @@ Multi-user architecture:
 - dcc.Interval provides fallback polling if WebSocket disconnects
 """
 
+import atexit
+import functools
+import hashlib
+import importlib.util
+import itertools
+import json
 import logging
 import os
 import re
 import threading
 import time
-import uuid
 from collections import deque
-from datetime import date, datetime
+from datetime import date
 
-from dash import Dash, Input, Output, State, callback, ctx, html, no_update
+from dash import Dash, Input, Output, State, callback, html, no_update
 from flask import Response, jsonify, send_file
 from flask import request as flask_request
 from flask_socketio import SocketIO, emit
+from plotly.io.json import to_json_plotly
 
 from ..bloomberg import MockBloombergClient
 from ..models import (
@@ -31,8 +37,9 @@ from ..models import (
     QuoteSide,
     Side,
 )
+from ..order_store import DebouncedOrderSaver
+from ..order_store import load_order_rows as store_load_order_rows
 from ..order_store import load_orders as store_load_orders
-from ..order_store import save_orders as store_save_orders
 from ..parser import parse_expiry, parse_order
 from ..settings import (
     BRIDGE_DEFAULT_PORT,
@@ -44,30 +51,57 @@ from ..settings import (
 from ..structure_pricer import price_structure_from_market
 from .layouts import (
     COLORS,
-    _BLOTTER_COLUMNS,
+    _BLOTTER_COLUMN_DEFS,
+    _BLOTTER_ROW_KEYS,
+    _BLOTTER_SELECT_VALUES,
+    _DELETE_DETAIL_SLOT,
     _EMPTY_ROW,
-    _MODAL_OVERLAY_STYLE,
+    _ORDER_EXAMPLE,
+    _PNL_SIGN,
+    _class_stylesheet,
+    _delete_modal_body,
+    _fonts_head,
     _make_empty_rows,
+    _table_dropdown_stylesheet,
     _to_blotter_rows,
     create_layout,
 )
 
 logger = logging.getLogger(__name__)
 
+# Gzip layout/callback JSON when flask-compress is installed (speedups extra);
+# the repeated style keys and colour strings compress several x
+_COMPRESS = importlib.util.find_spec("flask_compress") is not None
+
 app = Dash(
     __name__,
+    compress=_COMPRESS,
     suppress_callback_exceptions=True,
+    # Every callback is user/event-driven except the one-shot page-load
+    # setup ones, which opt back in with prevent_initial_call=False
+    prevent_initial_callbacks=True,
     external_scripts=["https://cdn.socket.io/4.7.5/socket.io.min.js"],
 )
 app.title = "IDB Options Pricer"
+if _COMPRESS:
+    app.server.config.update(
+        COMPRESS_MIN_SIZE=1024,
+        COMPRESS_MIMETYPES=[
+            "application/json", "text/html", "text/css", "application/javascript",
+        ],
+    )
+else:
+    logger.info("flask-compress not installed — serving responses uncompressed")
 
-# Set body/html background so no white bars appear at any viewport width
+# Web fonts load from <head> (non-blocking); set body/html background so no
+# white bars appear at any viewport width
 app.index_string = '''<!DOCTYPE html>
 <html>
     <head>
         {%metas%}
         <title>{%title%}</title>
         {%favicon%}
+        ''' + _fonts_head() + '''
         {%css%}
         <style>
             html, body {
@@ -75,6 +109,10 @@ app.index_string = '''<!DOCTYPE html>
                 margin: 0;
                 padding: 0;
             }
+            summary.btn { list-style: none; }
+            summary.btn::-webkit-details-marker { display: none; }
+''' + _class_stylesheet() + '''
+''' + _table_dropdown_stylesheet() + '''
         </style>
     </head>
     <body>
@@ -87,7 +125,7 @@ app.index_string = '''<!DOCTYPE html>
     </body>
 </html>'''
 
-app.layout = create_layout  # callable — Dash invokes per page load
+app.layout = create_layout()
 
 # Flask-SocketIO for multi-user live updates
 socketio = SocketIO(app.server, cors_allowed_origins="*", async_mode="threading")
@@ -161,15 +199,76 @@ class _GlobalRateLimiter:
 
 _rate_limiter = _GlobalRateLimiter(max_requests=15)
 
+# Flask paths under the app's routes prefix, so a prefixed mount still matches
+_ORDERS_ROUTE = app.config.routes_pathname_prefix + "api/orders"
+_RATE_LIMITED_PATHS = frozenset({
+    app.config.routes_pathname_prefix + "_dash-update-component",
+    _ORDERS_ROUTE,
+})
+
 
 @app.server.before_request
 def _check_rate_limit():
-    """Rate-limit Dash callback requests to 15/sec globally."""
-    if flask_request.path == "/_dash-update-component":
+    """Rate-limit Dash callback and order-fetch requests to 15/sec globally."""
+    if flask_request.path in _RATE_LIMITED_PATHS:
         if not _rate_limiter.allow():
             return jsonify({"error": "Rate limit exceeded. Try again shortly."}), 429
 
 
+# ---------------------------------------------------------------------------
+# Background order persistence — keeps SQLite writes off the callback path
+# ---------------------------------------------------------------------------
+
+_order_saver = DebouncedOrderSaver()
+atexit.register(_order_saver.close)
+
+
+# ---------------------------------------------------------------------------
+# Route: order records for the page-load blotter fill
+# ---------------------------------------------------------------------------
+
+@app.server.route(_ORDERS_ROUTE)
+def api_orders():
+    """Full order records as a JSON array, straight from the stored JSON text."""
+    _order_saver.flush()
+    return Response("[" + ",".join(store_load_order_rows()) + "]",
+                    mimetype="application/json")
+
+
+# Page load: fill order-store and the blotter from /api/orders, off the
+# layout's critical path. Rows are built in the browser the same way
+# _to_blotter_rows builds them (public fields + pnl_sign).
+app.clientside_callback(
+    """
+    async function(loaded) {
+        var nu = window.dash_clientside.no_update;
+        var resp = await fetch(%s, {cache: "no-store"});
+        if (!resp.ok) return [nu, nu];
+        var orders = await resp.json();
+        var keys = %s, pnlSign = %s;
+        var rows = orders.map(function(o) {
+            var row = {};
+            for (var i = 0; i < keys.length; i++) {
+                if (keys[i] in o) row[keys[i]] = o[keys[i]];
+            }
+            row.pnl_sign = pnlSign[(o.pnl || "").charAt(0)] || "";
+            return row;
+        });
+        return [orders, rows];
+    }
+    """ % (
+        json.dumps(app.config.requests_pathname_prefix + "api/orders"),
+        json.dumps(_BLOTTER_ROW_KEYS),
+        json.dumps(dict(_PNL_SIGN)),
+    ),
+    Output("order-store", "data", allow_duplicate=True),
+    Output("blotter-table", "rowData", allow_duplicate=True),
+    Input("page-load", "data"),
+    # Runs on page load even though add_order also owns order-store
+    prevent_initial_call="initial_duplicate",
+)
+
+
 # ---------------------------------------------------------------------------
 # Route: serve standalone bridge as a downloadable .py file
 # ---------------------------------------------------------------------------
@@ -191,50 +290,51 @@ def download_bridge():
     )
 
 
-# Clientside callback: Enter key in textarea triggers pricing
+# Clientside callback: Enter key in textarea triggers pricing.
+# Runs once on page load; the listener is delegated from document so it
+# doesn't need the textarea to exist yet or a re-bind on every keystroke.
 app.clientside_callback(
     """
-    function(id) {
-        var textarea = document.getElementById("order-text");
-        if (textarea && !textarea._enterBound) {
-            textarea.addEventListener("keydown", function(e) {
-                if (e.key === "Enter" && !e.shiftKey) {
+    function(loaded) {
+        if (!window._orderEnterBound) {
+            document.addEventListener("keydown", function(e) {
+                if (e.target && e.target.id === "order-text"
+                        && e.key === "Enter" && !e.shiftKey) {
                     e.preventDefault();
-                    var store = document.getElementById("textarea-enter");
                     var btn = document.getElementById("price-btn");
                     if (btn) btn.click();
                 }
             });
-            textarea._enterBound = true;
+            window._orderEnterBound = true;
         }
         return window.dash_clientside.no_update;
     }
     """,
     Output("textarea-enter", "data"),
-    Input("order-text", "value"),
+    Input("page-load", "data"),
+    prevent_initial_call=False,
 )
 
 # Clientside callback: Enter key in username input triggers submit
 app.clientside_callback(
     """
-    function(id) {
-        var input = document.getElementById("username-input");
-        if (input && !input._enterBound) {
-            input.addEventListener("keydown", function(e) {
-                if (e.key === "Enter") {
+    function(loaded) {
+        if (!window._usernameEnterBound) {
+            document.addEventListener("keydown", function(e) {
+                if (e.target && e.target.id === "username-input" && e.key === "Enter") {
                     e.preventDefault();
                     var btn = document.getElementById("username-submit-btn");
                     if (btn) btn.click();
                 }
             });
-            input._enterBound = true;
+            window._usernameEnterBound = true;
         }
         return window.dash_clientside.no_update;
     }
     """,
     Output("username-error", "children"),
-    Input("username-input", "value"),
-    prevent_initial_call=True,
+    Input("page-load", "data"),
+    prevent_initial_call=False,
 )
 
 # Clientside callback: SocketIO client setup for live blotter sync
@@ -253,8 +353,17 @@ app.clientside_callback(
                     sio.emit('register', {username: username});
                 });
 
+                // Another client (or this one) changed the blotter: resync now
                 sio.on('blotter_changed', function(data) {
-                    // fallback polling will pick up changes
+                    window.dash_clientside.set_props("ws-blotter-refresh", {data: Date.now()});
+                });
+
+                // Hidden tabs stop the fallback resync and catch up on return
+                document.addEventListener("visibilitychange", function() {
+                    window.dash_clientside.set_props("blotter-resync", {disabled: document.hidden});
+                    if (!document.hidden) {
+                        window.dash_clientside.set_props("ws-blotter-refresh", {data: Date.now()});
+                    }
                 });
 
                 sio.on('user_count', function(data) {
@@ -299,7 +408,10 @@ def _get_mock_client():
 # Reusable style constants
 # ---------------------------------------------------------------------------
 
+# Shared read-only style dicts: callbacks return these directly, never mutate them
 _HIDDEN = {"display": "none"}
+# Elements whose look comes from a stylesheet class show by clearing style
+_CLASS_SHOWN = {}
 
 _HEADER_VISIBLE_STYLE = {
     "backgroundColor": COLORS["bg_card"],
@@ -321,6 +433,15 @@ _BROKER_VISIBLE_STYLE = {
     "alignItems": "center",
 }
 
+_HEADER_TITLE_STYLE = {"color": COLORS["text_accent"], "fontWeight": "bold", "fontSize": "17px"}
+
+# Header stats render as one text node; two em spaces match the 28px flex gap
+_HEADER_STAT_SEP = "\u2003\u2003"
+
+_BROKER_TEXT_STYLE = {"fontSize": "16px", "marginRight": "30px"}
+_EDGE_POSITIVE_STYLE = {"fontSize": "16px", "color": COLORS["positive"], "fontWeight": "bold"}
+_EDGE_NEGATIVE_STYLE = {"fontSize": "16px", "color": COLORS["negative"], "fontWeight": "bold"}
+
 _ORDER_INPUT_VISIBLE_STYLE = {
     "backgroundColor": COLORS["bg_card"],
     "padding": "14px 20px",
@@ -370,9 +491,35 @@ STRUCTURE_TEMPLATES = {
     ],
 }
 
+# Pricing-table rows for each template, built once. Callbacks only hand these
+# to Dash for serialization, so sharing them across requests is safe.
+_STRUCTURE_ROWS = {
+    name: [
+        _EMPTY_ROW | {
+            "leg": f"Leg {i + 1}",
+            "type": t["type"],
+            "side": t["side"],
+            "qty": t.get("qty", 1),
+        }
+        for i, t in enumerate(template)
+    ]
+    for name, template in STRUCTURE_TEMPLATES.items()
+}
+
+# Structure key <-> display name ("put_spread" <-> "put spread"), built once
+_STRUCT_DISPLAY = {k: k.replace("_", " ") for k in STRUCTURE_TEMPLATES}
+_STRUCT_KEY_BY_NAME = {v: k for k, v in _STRUCT_DISPLAY.items()}
+
 # Map short codes to model enums
 _TYPE_MAP = {"C": OptionType.CALL, "P": OptionType.PUT}
 _SIDE_MAP = {"B": Side.BUY, "S": Side.SELL}
+_TYPE_CODE = {v: k for k, v in _TYPE_MAP.items()}
+_SIDE_CODE = {v: k for k, v in _SIDE_MAP.items()}
+
+# Serialized enum value -> member, avoiding Enum.__call__ on every lookup
+_OPTION_TYPE_BY_VALUE = {m.value: m for m in OptionType}
+_SIDE_BY_VALUE = {m.value: m for m in Side}
+_QUOTE_SIDE_BY_VALUE = {m.value: m for m in QuoteSide}
 
 
 
@@ -415,8 +562,8 @@ def _deserialize_parsed_order(data: dict) -> ParsedOrder:
             underlying=ld["underlying"],
             expiry=date.fromisoformat(ld["expiry"]),
             strike=ld["strike"],
-            option_type=OptionType(ld["option_type"]),
-            side=Side(ld["side"]),
+            option_type=_OPTION_TYPE_BY_VALUE[ld["option_type"]],
+            side=_SIDE_BY_VALUE[ld["side"]],
             quantity=ld["quantity"],
             ratio=ld.get("ratio", 1),
         ))
@@ -430,7 +577,7 @@ def _deserialize_parsed_order(data: dict) -> ParsedOrder:
         stock_ref=data["stock_ref"],
         delta=data["delta"],
         price=data["price"],
-        quote_side=QuoteSide(data["quote_side"]),
+        quote_side=_QUOTE_SIDE_BY_VALUE[data["quote_side"]],
         quantity=data["quantity"],
         raw_text=data.get("raw_text", ""),
     )
@@ -479,23 +626,23 @@ def _price_with_market_data(order: ParsedOrder, mkt_response: dict) -> tuple:
 def _fetch_and_price_fallback(order: ParsedOrder) -> tuple:
     """Fallback: fetch from mock client when bridge is unreachable."""
     client = _get_mock_client()
-    spot = client.get_spot(order.underlying)
+    spot, leg_quotes, multiplier = client.get_structure_quotes(
+        order.underlying,
+        [(leg.expiry, leg.strike, leg.option_type.value) for leg in order.structure.legs],
+    )
     if spot is None or spot == 0:
         spot = order.stock_ref if order.stock_ref > 0 else 100.0
 
-    quotes = []
-    for leg in order.structure.legs:
-        quote = client.get_option_quote(
-            leg.underlying, leg.expiry, leg.strike, leg.option_type.value,
-        )
-        quotes.append({
+    quotes = [
+        {
             "bid": quote.bid,
             "bid_size": quote.bid_size,
             "offer": quote.offer,
             "offer_size": quote.offer_size,
-        })
+        }
+        for quote in leg_quotes
+    ]
 
-    multiplier = client.get_contract_multiplier(order.underlying)
     mkt_response = {"spot": spot, "quotes": quotes, "multiplier": multiplier}
     return _price_with_market_data(order, mkt_response)
 
@@ -507,10 +654,11 @@ def _build_table_data(order, leg_market, struct_data):
         min(leg.quantity for leg in order.structure.legs)
         if order.structure.legs else 1
     )
+    fmt = "{:.2f}".format
 
     for i, (leg, mkt) in enumerate(zip(order.structure.legs, leg_market)):
-        type_code = "C" if leg.option_type == OptionType.CALL else "P"
-        side_code = "B" if leg.side == Side.BUY else "S"
+        type_code = _TYPE_CODE[leg.option_type]
+        side_code = _SIDE_CODE[leg.side]
         exp_str = leg.expiry.strftime("%b%y") if leg.expiry else ""
         ratio = leg.quantity // base_qty
 
@@ -523,9 +671,9 @@ def _build_table_data(order, leg_market, struct_data):
             "side": side_code,
             "qty": ratio,
             "bid_size": str(mkt.bid_size),
-            "bid": f"{mkt.bid:.2f}",
-            "mid": f"{mid:.2f}",
-            "offer": f"{mkt.offer:.2f}",
+            "bid": fmt(mkt.bid),
+            "mid": fmt(mid),
+            "offer": fmt(mkt.offer),
             "offer_size": str(mkt.offer_size),
         })
 
@@ -534,9 +682,9 @@ def _build_table_data(order, leg_market, struct_data):
         "leg": "Structure",
         "expiry": "", "strike": "", "type": "", "side": "", "qty": "",
         "bid_size": str(struct_data.structure_bid_size),
-        "bid": f"{abs(struct_data.structure_bid):.2f}",
-        "mid": f"{abs(struct_data.structure_mid):.2f}",
-        "offer": f"{abs(struct_data.structure_offer):.2f}",
+        "bid": fmt(abs(struct_data.structure_bid)),
+        "mid": fmt(abs(struct_data.structure_mid)),
+        "offer": fmt(abs(struct_data.structure_offer)),
         "offer_size": str(struct_data.structure_offer_size),
     })
 
@@ -545,42 +693,34 @@ def _build_table_data(order, leg_market, struct_data):
 
 def _build_header_and_extras(order, spot, struct_data, multiplier):
     """Build order header, broker quote, current-structure store, order input style."""
-    header_items = []
     structure_name = order.structure.name.upper()
-    header_items.append(
-        html.Span(
-            f"{order.underlying} {structure_name}",
-            style={"color": COLORS["text_accent"], "fontWeight": "bold", "fontSize": "17px"},
-        )
-    )
+    stats = []
     if order.stock_ref > 0:
-        header_items.append(html.Span(f"Tie: ${order.stock_ref:.2f}"))
-    header_items.append(html.Span(f"Stock: ${spot:.2f}"))
+        stats.append(f"Tie: ${order.stock_ref:.2f}")
+    stats.append(f"Stock: ${spot:.2f}")
     if order.delta != 0:
-        header_items.append(html.Span(f"Delta: {order.delta:+.0f}"))
+        stats.append(f"Delta: {order.delta:+.0f}")
+    header_items = [
+        html.Span(f"{order.underlying} {structure_name}", style=_HEADER_TITLE_STYLE),
+        _HEADER_STAT_SEP.join(stats),
+    ]
 
     broker_style = _HIDDEN
     broker_content = []
     if order.price > 0:
         side_label = order.quote_side.value.upper()
+        edge = order.price - abs(struct_data.structure_mid)
         broker_content = [
-            html.Span(
-                f"Broker: {order.price:.2f} {side_label}",
-                style={"fontSize": "16px", "marginRight": "30px"},
-            ),
+            html.Span(f"Broker: {order.price:.2f} {side_label}", style=_BROKER_TEXT_STYLE),
             html.Span(
                 f"Screen Mid: {abs(struct_data.structure_mid):.2f}",
-                style={"fontSize": "16px", "marginRight": "30px"},
+                style=_BROKER_TEXT_STYLE,
             ),
-        ]
-        edge = order.price - abs(struct_data.structure_mid)
-        edge_color = COLORS["positive"] if edge > 0 else COLORS["negative"]
-        broker_content.append(
             html.Span(
                 f"Edge: {edge:+.2f}",
-                style={"fontSize": "16px", "color": edge_color, "fontWeight": "bold"},
-            )
-        )
+                style=_EDGE_POSITIVE_STYLE if edge > 0 else _EDGE_NEGATIVE_STYLE,
+            ),
+        ]
         broker_style = _BROKER_VISIBLE_STYLE
 
     leg_details = []
@@ -609,48 +749,90 @@ def _build_header_and_extras(order, spot, struct_data, multiplier):
     )
 
 
+_EXPIRY_RE = re.compile(r'^([A-Za-z]{3})(\d{2})?$')
+
+
+# Order IDs: millisecond start time in the high bits keeps them increasing
+# across restarts; stepping past the low 16 bits leaves the pid there so
+# concurrent processes never hand out the same ID.
+_order_ids = itertools.count(
+    (int(time.time() * 1000) << 16) | (os.getpid() & 0xFFFF), 1 << 16,
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _format_minute(minute: int) -> str:
+    """Local HH:MM for an epoch minute."""
+    return time.strftime("%H:%M", time.localtime(minute * 60))
+
+
+def _added_time() -> str:
+    """Current local time as HH:MM, reformatted only when the minute changes."""
+    return _format_minute(int(time.time() // 60))
+
+
 def _parse_expiry_str(expiry_str: str) -> date:
     """Parse an expiry string like 'Jun26' or 'Mar27' into a date."""
-    s = expiry_str.strip()
-    m = re.match(r'^([A-Za-z]{3})(\d{2})?$', s)
+    # today is part of the cache key: year-less expiries ("Apr") roll forward
+    return _parse_expiry_cached(expiry_str.strip(), date.today())
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_expiry_cached(s: str, today: date) -> date:
+    m = _EXPIRY_RE.match(s)
     if not m:
-        raise ValueError(f"Invalid expiry format: '{expiry_str}'. Use e.g. Jun26, Mar27")
+        raise ValueError(f"Invalid expiry format: '{s}'. Use e.g. Jun26, Mar27")
     month_str = m.group(1)
     year_str = m.group(2)
     return parse_expiry(month_str, year_str)
 
 
+def _cell_str(value) -> str:
+    """Stripped string form of a table cell (None -> "")."""
+    if not value:
+        return ""
+    return (value if isinstance(value, str) else str(value)).strip()
+
+
 def _build_legs_from_table(table_data, underlying, order_qty):
     """Parse table rows into OptionLeg list. Returns (legs, error_msg) tuple."""
-    leg_rows = [r for r in (table_data or []) if r.get("leg", "").startswith("Leg")]
+    type_map = _TYPE_MAP
+    side_map = _SIDE_MAP
+    parse_expiry_str = _parse_expiry_str
 
     legs: list[OptionLeg] = []
-    for i, row in enumerate(leg_rows):
-        expiry_str = str(row.get("expiry", "")).strip()
+    i = -1
+    for row in table_data or ():
+        leg_label = row.get("leg")
+        if not leg_label or not leg_label.startswith("Leg"):
+            continue
+        i += 1
+
+        expiry_str = _cell_str(row.get("expiry"))
         strike_val = row.get("strike")
-        type_val = str(row.get("type", "")).strip()
-        side_val = str(row.get("side", "")).strip()
-        qty_val = row.get("qty")
+        type_val = _cell_str(row.get("type"))
+        side_val = _cell_str(row.get("side"))
 
         row_has_data = bool(expiry_str or strike_val or type_val or side_val)
         if not row_has_data:
             continue
 
-        if not expiry_str or not strike_val or type_val not in ("C", "P") or side_val not in ("B", "S"):
+        if not expiry_str or not strike_val or type_val not in type_map or side_val not in side_map:
             return None, None  # Incomplete row — caller decides how to handle
 
         try:
-            expiry = _parse_expiry_str(expiry_str)
+            expiry = parse_expiry_str(expiry_str)
         except ValueError as e:
             return None, f"Leg {i + 1}: {e}"
 
+        qty_val = row.get("qty")
         qty = int(qty_val) if qty_val else 1
         legs.append(OptionLeg(
             underlying=underlying,
             expiry=expiry,
             strike=float(strike_val),
-            option_type=_TYPE_MAP[type_val],
-            side=_SIDE_MAP[side_val],
+            option_type=type_map[type_val],
+            side=side_map[side_val],
             quantity=qty * order_qty,
             ratio=qty,
         ))
@@ -662,6 +844,26 @@ def _build_legs_from_table(table_data, underlying, order_qty):
 # Callback: paste-to-parse pricing
 # ---------------------------------------------------------------------------
 
+# Everything after parse-error left untouched
+_PARSE_NOOP_TAIL = (
+    no_update, no_update, no_update,  # pricing-context, mkt-request, fetch-trigger
+    no_update, no_update,  # underlying, structure-type
+    no_update, no_update,  # stock-ref, delta
+    no_update, no_update,  # broker-price, quote-side
+    no_update,             # quantity
+    no_update, no_update,  # suppress-template, auto-price-suppress
+    no_update,             # auto-price-sig
+)
+
+# Parse the placeholder example once at import: the parser's patterns compile
+# into re's cache here (inherited by forked workers) rather than on the first
+# user's click
+try:
+    parse_order(_ORDER_EXAMPLE)
+except ValueError:
+    logger.warning("Placeholder order failed to parse: %r", _ORDER_EXAMPLE)
+
+
 @callback(
     Output("parse-error", "children"),
     Output("pricing-context", "data"),
@@ -676,6 +878,7 @@ def _build_legs_from_table(table_data, underlying, order_qty):
     Output("manual-quantity", "value"),
     Output("suppress-template", "data"),
     Output("auto-price-suppress", "data"),
+    Output("auto-price-sig", "data"),
     Input("price-btn", "n_clicks"),
     State("order-text", "value"),
     State("fetch-trigger", "data"),
@@ -683,14 +886,7 @@ def _build_legs_from_table(table_data, underlying, order_qty):
 )
 def parse_order_step(n_clicks, order_text, current_trigger):
     """Phase 1: Parse order text and request market data from bridge."""
-    noop_tail = (
-        no_update, no_update, no_update,  # pricing-context, mkt-request, fetch-trigger
-        no_update, no_update,  # underlying, structure-type
-        no_update, no_update,  # stock-ref, delta
-        no_update, no_update,  # broker-price, quote-side
-        no_update,             # quantity
-        no_update, no_update,  # suppress-template, auto-price-suppress
-    )
+    noop_tail = _PARSE_NOOP_TAIL
 
     if not order_text:
         return ("Please enter an order.", *noop_tail)
@@ -704,8 +900,7 @@ def parse_order_step(n_clicks, order_text, current_trigger):
     mkt_request = _build_market_data_request(order)
     new_trigger = (current_trigger or 0) + 1
 
-    struct_name = order.structure.name.lower().replace(" ", "_")
-    struct_dropdown = struct_name if struct_name in STRUCTURE_TEMPLATES else None
+    struct_dropdown = _STRUCT_KEY_BY_NAME.get(order.structure.name.lower())
 
     return (
         "",                         # parse-error
@@ -721,6 +916,7 @@ def parse_order_step(n_clicks, order_text, current_trigger):
         order.quantity if order.quantity > 0 else None,
         True,                       # suppress-template
         True,                       # auto-price-suppress
+        None,                       # auto-price-sig (display no longer from table)
     )
 
 
@@ -767,14 +963,13 @@ app.clientside_callback(
 # Phase 3: Price with market data (from bridge or fallback)
 # ---------------------------------------------------------------------------
 
+_PRICE_NOOP = (no_update,) * 4
+
 @callback(
     Output("pricing-display", "data"),
-    Output("order-header", "style"),
-    Output("order-header-content", "children"),
-    Output("broker-quote-section", "style"),
-    Output("broker-quote-content", "children"),
     Output("current-structure", "data"),
-    Output("order-input-section", "style"),
+    Output("pricer-snapshot", "data"),
+    Output("auto-price-sig", "data", allow_duplicate=True),
     Input("market-data-response", "data"),
     State("pricing-context", "data"),
     prevent_initial_call=True,
@@ -782,30 +977,70 @@ app.clientside_callback(
 def price_with_market_data(mkt_response, pricing_ctx):
     """Phase 3: Use market data to price the structure and update display."""
     if not mkt_response or not pricing_ctx:
-        return (no_update,) * 7
+        return _PRICE_NOOP
 
     order = _deserialize_parsed_order(pricing_ctx)
 
-    if mkt_response.get("_fallback"):
-        # Bridge unreachable — use server-side mock
-        spot, leg_market, struct_data, multiplier = _fetch_and_price_fallback(order)
-    else:
-        spot, leg_market, struct_data, multiplier = _price_with_market_data(order, mkt_response)
+    # A failed fetch or empty quotes clears the auto-price signature, so the
+    # next table event retries instead of being skipped as unchanged
+    sig = no_update
+    try:
+        if mkt_response.get("_fallback"):
+            # Bridge unreachable — use server-side mock
+            sig = None
+            spot, leg_market, struct_data, multiplier = _fetch_and_price_fallback(order)
+        else:
+            if not mkt_response.get("quotes"):
+                sig = None
+            spot, leg_market, struct_data, multiplier = _price_with_market_data(order, mkt_response)
+    except Exception:
+        logger.warning("Pricing %s failed", order.underlying, exc_info=True)
+        return (*_PRICE_NOOP[:3], None)
 
     table_data = _build_table_data(order, leg_market, struct_data)
     header_style, header_items, broker_style, broker_content, current_data, order_input_style = (
         _build_header_and_extras(order, spot, struct_data, multiplier)
     )
 
-    return (
-        table_data,
-        header_style,
-        header_items,
-        broker_style,
-        broker_content,
-        current_data,
-        order_input_style,
-    )
+    # Header / broker / order-input props travel as one blob, fanned out
+    # clientside (clear and recall write the same store)
+    snapshot = {
+        "header_style": header_style,
+        "header_items": header_items,
+        "broker_style": broker_style,
+        "broker_content": broker_content,
+        "order_input_style": order_input_style,
+    }
+    return table_data, current_data, snapshot, sig
+
+
+app.clientside_callback(
+    """
+    function(snap) {
+        var nu = window.dash_clientside.no_update;
+        var keys = ["header_style", "header_items", "broker_style",
+                    "broker_content", "order_input_style"];
+        if (!snap) return keys.map(function() { return nu; });
+        // Only push the panel props that differ from the last snapshot, so a
+        // recall or reprice that leaves a panel as-is doesn't re-render it
+        var prev = window._pricerSnapshotSent || {};
+        var sent = {};
+        var out = keys.map(function(k) {
+            sent[k] = JSON.stringify(snap[k]);
+            return sent[k] === prev[k] ? nu : snap[k];
+        });
+        window._pricerSnapshotSent = sent;
+        return out;
+    }
+    """,
+    Output("order-header", "style"),
+    Output("order-header-content", "children"),
+    Output("broker-quote-section", "style"),
+    Output("broker-quote-content", "children"),
+    Output("order-input-section", "style"),
+    Input("pricer-snapshot", "data"),
+    prevent_initial_call=True,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -824,19 +1059,10 @@ def populate_table_template(structure_type, suppress):
     if suppress:
         return no_update, False, no_update
 
-    template = STRUCTURE_TEMPLATES.get(structure_type, [])
-    if not template:
+    rows = _STRUCTURE_ROWS.get(structure_type)
+    if not rows:
         return no_update, False, no_update
 
-    rows = []
-    for i, t in enumerate(template):
-        rows.append({
-            **_EMPTY_ROW,
-            "leg": f"Leg {i + 1}",
-            "type": t["type"],
-            "side": t["side"],
-            "qty": t.get("qty", 1),
-        })
     return rows, False, True
 
 
@@ -844,7 +1070,23 @@ def populate_table_template(structure_type, suppress):
 # Callback: add/remove table rows
 # ---------------------------------------------------------------------------
 
-@callback(
+# Pure reshaping of the table data, so it runs in the browser: no round trip
+app.clientside_callback(
+    """
+    function(addClicks, removeClicks, data) {
+        var rows = (data || []).slice();
+        // The structure summary row, when present, is always last
+        if (rows.length && rows[rows.length - 1].leg === "Structure") rows.pop();
+
+        var triggered = window.dash_clientside.callback_context.triggered_id;
+        if (triggered === "add-row-btn") {
+            rows.push(Object.assign({}, %s, {leg: "Leg " + (rows.length + 1)}));
+        } else if (triggered === "remove-row-btn" && rows.length > 1) {
+            rows.pop();
+        }
+        return [rows, true];
+    }
+    """ % json.dumps(dict(_EMPTY_ROW)),
     Output("pricing-display", "data", allow_duplicate=True),
     Output("auto-price-suppress", "data", allow_duplicate=True),
     Input("add-row-btn", "n_clicks"),
@@ -852,29 +1094,42 @@ def populate_table_template(structure_type, suppress):
     State("pricing-display", "data"),
     prevent_initial_call=True,
 )
-def toggle_table_rows(add_clicks, remove_clicks, current_data):
-    triggered = ctx.triggered_id
-    rows = [r for r in (current_data or []) if r.get("leg") != "Structure"]
-
-    if triggered == "add-row-btn":
-        n = len(rows) + 1
-        rows.append({**_EMPTY_ROW, "leg": f"Leg {n}"})
-    elif triggered == "remove-row-btn" and len(rows) > 1:
-        rows.pop()
-
-    return rows, True
 
 
 # ---------------------------------------------------------------------------
 # Callback: auto-price from table
 # ---------------------------------------------------------------------------
 
+# Clears table-error and auto-price-suppress, leaves the rest untouched
+_AUTO_PRICE_NOOP = ("",) + (no_update,) * 3 + (False, no_update)
+
+# Table columns _build_legs_from_table reads; quote columns don't affect the request
+_AUTO_PRICE_ROW_FIELDS = ("leg", "expiry", "strike", "type", "side", "qty")
+
+
+def _auto_price_sig(underlying, table_data, struct_type, stock_ref,
+                    delta, broker_price, quote_side_val, order_qty) -> str:
+    """Digest of everything auto_price_request turns into a pricing request.
+
+    Deterministic (unlike hash(), which is salted per process), so a stored
+    signature means the same thing to every worker and across restarts.
+    """
+    rows = [[row.get(f) for f in _AUTO_PRICE_ROW_FIELDS] for row in table_data or ()]
+    payload = json.dumps(
+        [underlying, rows, struct_type, stock_ref, delta,
+         broker_price, quote_side_val, order_qty],
+        default=str,
+    )
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
 @callback(
     Output("table-error", "children"),
     Output("pricing-context", "data", allow_duplicate=True),
     Output("market-data-request", "data", allow_duplicate=True),
     Output("fetch-trigger", "data", allow_duplicate=True),
     Output("auto-price-suppress", "data", allow_duplicate=True),
+    Output("auto-price-sig", "data", allow_duplicate=True),
     Input("pricing-display", "data_timestamp"),
     Input("manual-underlying", "value"),
     State("auto-price-suppress", "data"),
@@ -886,14 +1141,15 @@ def toggle_table_rows(add_clicks, remove_clicks, current_data):
     State("manual-quote-side", "value"),
     State("manual-quantity", "value"),
     State("fetch-trigger", "data"),
+    State("auto-price-sig", "data"),
     prevent_initial_call=True,
 )
 def auto_price_request(data_ts, underlying, suppress,
                        table_data, struct_type, stock_ref,
                        delta, broker_price, quote_side_val, order_qty,
-                       current_trigger):
+                       current_trigger, prior_sig):
     """Auto-price from table edits — Phase 1: build request, trigger fetch."""
-    noop = ("",) + (no_update,) * 3 + (False,)
+    noop = _AUTO_PRICE_NOOP
 
     if suppress:
         return noop
@@ -901,25 +1157,31 @@ def auto_price_request(data_ts, underlying, suppress,
     if not underlying or not underlying.strip():
         return noop
 
+    # Skip the refetch when no pricing input moved (e.g. quotes written back)
+    sig = _auto_price_sig(underlying, table_data, struct_type, stock_ref,
+                          delta, broker_price, quote_side_val, order_qty)
+    if sig == prior_sig:
+        return noop
+
     underlying = underlying.strip().upper()
     order_qty_val = int(order_qty) if order_qty else 1
 
     legs, err_msg = _build_legs_from_table(table_data, underlying, order_qty_val)
 
     if err_msg:
-        return (err_msg,) + (no_update,) * 3 + (False,)
+        return (err_msg, *_AUTO_PRICE_NOOP[1:])
 
     if legs is None or len(legs) == 0:
         return noop
 
-    struct_name = struct_type.replace("_", " ") if struct_type else "custom"
+    struct_name = _STRUCT_DISPLAY.get(struct_type, "custom") if struct_type else "custom"
     order = ParsedOrder(
         underlying=underlying,
         structure=OptionStructure(name=struct_name, legs=legs, description="Table entry"),
         stock_ref=float(stock_ref) if stock_ref else 0.0,
         delta=float(delta) if delta else 0.0,
         price=float(broker_price) if broker_price else 0.0,
-        quote_side=QuoteSide(quote_side_val) if quote_side_val else QuoteSide.BID,
+        quote_side=_QUOTE_SIDE_BY_VALUE.get(quote_side_val, QuoteSide.BID),
         quantity=order_qty_val,
         raw_text="Table entry",
     )
@@ -934,6 +1196,7 @@ def auto_price_request(data_ts, underlying, suppress,
         mkt_request,        # market-data-request
         new_trigger,        # fetch-trigger
         True,               # auto-price-suppress (prevent self-loop)
+        sig,                # auto-price-sig
     )
 
 
@@ -941,7 +1204,37 @@ def auto_price_request(data_ts, underlying, suppress,
 # Callback: clear / reset (does NOT clear the order blotter)
 # ---------------------------------------------------------------------------
 
-@callback(
+_CLEARED_SNAPSHOT = {
+    "header_style": _HIDDEN,
+    "header_items": [],
+    "broker_style": _HIDDEN,
+    "broker_content": [],
+    "order_input_style": _HIDDEN,
+}
+
+# Every output is a constant, so the reset happens in the browser
+app.clientside_callback(
+    """
+    function(nClicks) {
+        return %s;
+    }
+    """ % json.dumps([
+        _make_empty_rows(2),  # pricing-display
+        "",                   # order-text
+        None,                 # manual-underlying
+        None,                 # manual-structure-type
+        None,                 # manual-stock-ref
+        None,                 # manual-delta
+        None,                 # manual-broker-price
+        None,                 # manual-quote-side (neutral)
+        None,                 # manual-quantity (empty)
+        _CLEARED_SNAPSHOT,    # pricer-snapshot (hides header/broker/order input)
+        None,                 # current-structure
+        "",                   # parse-error
+        "",                   # table-error
+        True,                 # auto-price-suppress
+        None,                 # auto-price-sig
+    ]),
     Output("pricing-display", "data", allow_duplicate=True),
     Output("order-text", "value"),
     Output("manual-underlying", "value", allow_duplicate=True),
@@ -951,39 +1244,15 @@ def auto_price_request(data_ts, underlying, suppress,
     Output("manual-broker-price", "value", allow_duplicate=True),
     Output("manual-quote-side", "value", allow_duplicate=True),
     Output("manual-quantity", "value", allow_duplicate=True),
-    Output("order-header", "style", allow_duplicate=True),
-    Output("order-header-content", "children", allow_duplicate=True),
-    Output("broker-quote-section", "style", allow_duplicate=True),
-    Output("broker-quote-content", "children", allow_duplicate=True),
+    Output("pricer-snapshot", "data", allow_duplicate=True),
     Output("current-structure", "data", allow_duplicate=True),
-    Output("order-input-section", "style", allow_duplicate=True),
     Output("parse-error", "children", allow_duplicate=True),
     Output("table-error", "children", allow_duplicate=True),
     Output("auto-price-suppress", "data", allow_duplicate=True),
+    Output("auto-price-sig", "data", allow_duplicate=True),
     Input("clear-btn", "n_clicks"),
     prevent_initial_call=True,
 )
-def clear_all(n_clicks):
-    return (
-        _make_empty_rows(2),  # pricing-display
-        "",                   # order-text
-        None,                 # manual-underlying
-        None,                 # manual-structure-type
-        None,                 # manual-stock-ref
-        None,                 # manual-delta
-        None,                 # manual-broker-price
-        None,                 # manual-quote-side (neutral)
-        None,                 # manual-quantity (empty)
-        _HIDDEN,              # order-header style
-        [],                   # order-header-content
-        _HIDDEN,              # broker-quote-section style
-        [],                   # broker-quote-content
-        None,                 # current-structure
-        _HIDDEN,              # order-input-section style
-        "",                   # parse-error
-        "",                   # table-error
-        True,                 # auto-price-suppress
-    )
 
 
 # ---------------------------------------------------------------------------
@@ -991,15 +1260,13 @@ def clear_all(n_clicks):
 # ---------------------------------------------------------------------------
 
 @callback(
-    Output("blotter-table", "data"),
+    Output("blotter-table", "rowTransaction"),
     Output("order-store", "data"),
     Output("order-error", "children"),
     Output("order-side", "value"),
     Output("order-size", "value"),
-    Output("blotter-edit-suppress", "data"),
     Input("add-order-btn", "n_clicks"),
     State("current-structure", "data"),
-    State("order-store", "data"),
     State("current-user", "data"),
     # Capture pricer state for recall
     State("pricing-display", "data"),
@@ -1012,21 +1279,23 @@ def clear_all(n_clicks):
     State("manual-quantity", "value"),
     prevent_initial_call=True,
 )
-def add_order(n_clicks, current_data, existing_orders, current_user,
+def add_order(n_clicks, current_data, current_user,
               table_data, toolbar_underlying, toolbar_struct, toolbar_ref,
               toolbar_delta, toolbar_broker_px, toolbar_quote_side, toolbar_qty):
     if not current_data:
-        return no_update, no_update, "Price a structure first.", no_update, no_update, no_update
+        return no_update, no_update, "Price a structure first.", no_update, no_update
 
     # Map toolbar side to blotter side
     side_map = {"bid": "Bid", "offer": "Offered"}
     blotter_side = side_map.get(toolbar_quote_side, "")
     size_str = str(int(toolbar_qty)) if toolbar_qty else ""
     mid = current_data["mid"]
+    broker_px = float(toolbar_broker_px) if toolbar_broker_px else 0.0
+    broker_quote = [broker_px, (toolbar_quote_side or "bid").upper()] if broker_px > 0 else None
 
     order_record = {
-        "id": str(uuid.uuid4()),
-        "added_time": datetime.now().strftime("%H:%M"),
+        "id": format(next(_order_ids), "x"),
+        "added_time": _added_time(),
         "created_by": current_user or "",
         "underlying": current_data["underlying"],
         "structure": f"{current_data['structure_name']} {current_data['structure_detail']}",
@@ -1053,209 +1322,334 @@ def add_order(n_clicks, current_data, existing_orders, current_user,
         "_quote_side": toolbar_quote_side,
         "_quantity": toolbar_qty,
         "_current_structure": current_data,
+        # [price, "BID"/"OFFER"] for the recall broker line, normalized once here
+        "_broker_quote": broker_quote,
     }
 
-    orders = existing_orders or []
-    orders.append(order_record)
-
-    # Persist to SQLite
-    store_save_orders(orders)
+    # Append to the saver's newest list, not this client's order-store, so an
+    # add racing a resync or another user's change can't drop or repeat rows.
+    # Persists to SQLite (debounced, off the callback thread).
+    orders = _order_saver.update(lambda orders: orders.append(order_record) or True)
 
     # Broadcast to other clients via WebSocket
     socketio.emit("blotter_changed", {"action": "added"}, to="/")
 
-    return _to_blotter_rows(orders), orders, "", None, None, True
+    # The grid only gets the new row, keyed by order id (getRowId)
+    return {"add": _to_blotter_rows([order_record])}, orders, "", None, None
 
 
 # ---------------------------------------------------------------------------
 # Callback: show delete confirmation modal when X column is clicked
 # ---------------------------------------------------------------------------
 
-@callback(
-    Output("delete-confirm-modal", "style"),
+app.clientside_callback(
+    """
+    function(cell) {
+        // Only the delete column opens the modal; rowId is the order id
+        // (getRowId), stable across sorting and paging
+        if (!cell || cell.colId !== "delete" || !cell.rowId) {
+            return window.dash_clientside.no_update;
+        }
+        return cell.rowId;
+    }
+    """,
     Output("pending-delete-id", "data"),
-    Output("delete-confirm-detail", "children"),
-    Input("blotter-table", "active_cell"),
-    State("blotter-table", "data"),
+    Input("blotter-table", "cellClicked"),
     prevent_initial_call=True,
 )
-def show_delete_modal(active_cell, blotter_data):
-    """Show confirmation modal when user clicks the X column."""
-    if not active_cell or not blotter_data:
-        return no_update, no_update, no_update
-
-    # Only trigger on the delete column
-    if active_cell.get("column_id") != "delete":
-        return {"display": "none"}, None, ""
-
-    row_idx = active_cell["row"]
-    if row_idx >= len(blotter_data):
-        return no_update, no_update, no_update
 
-    row = blotter_data[row_idx]
-    order_id = row.get("id")
-    if not order_id:
-        return no_update, no_update, no_update
 
-    detail = f"{row.get('underlying', '')} {row.get('structure', '')}"
-    return {"display": "block"}, order_id, detail
+# The modal is only in the DOM while a delete is pending: mount the prebuilt
+# body (with the order filled in) when the id is set, unmount when cleared.
+app.clientside_callback(
+    """
+    function(pendingId, orders) {
+        if (!pendingId) return null;
+        var order = null;
+        for (var j = 0; orders && j < orders.length; j++) {
+            if (orders[j].id === pendingId) { order = orders[j]; break; }
+        }
+        if (!order) return null;
+        var detail = (order.underlying || "") + " " + (order.structure || "");
+        return JSON.parse(%s.replace(%s, function() {
+            return JSON.stringify(detail);
+        }));
+    }
+    """ % (
+        json.dumps(to_json_plotly(_delete_modal_body())),
+        json.dumps(json.dumps(_DELETE_DETAIL_SLOT)),
+    ),
+    Output("delete-confirm-modal", "children"),
+    Input("pending-delete-id", "data"),
+    State("order-store", "data"),
+    prevent_initial_call=True,
+)
 
 
 @callback(
-    Output("blotter-table", "data", allow_duplicate=True),
+    Output("blotter-table", "rowTransaction", allow_duplicate=True),
     Output("order-store", "data", allow_duplicate=True),
-    Output("delete-confirm-modal", "style", allow_duplicate=True),
     Output("pending-delete-id", "data", allow_duplicate=True),
-    Output("blotter-edit-suppress", "data", allow_duplicate=True),
     Input("delete-confirm-btn", "n_clicks"),
     State("pending-delete-id", "data"),
-    State("order-store", "data"),
     prevent_initial_call=True,
 )
-def confirm_delete_order(n_clicks, pending_id, orders):
+def confirm_delete_order(n_clicks, pending_id):
     """Actually delete the order after user confirms."""
-    if not pending_id or not orders:
-        return no_update, no_update, {"display": "none"}, None, no_update
-
-    updated_orders = [o for o in orders if o.get("id") != pending_id]
-
-    # Persist to SQLite
-    store_save_orders(updated_orders)
+    if not n_clicks:
+        return no_update, no_update, no_update
+    if not pending_id:
+        return no_update, no_update, None
+
+    def remove(orders):
+        # Resolved by id against the saver's newest list, not this client's
+        for j, order in enumerate(orders):
+            if order.get("id") == pending_id:
+                del orders[j]
+                return True
+        return False
+
+    # Persist to SQLite (debounced, off the callback thread)
+    updated_orders = _order_saver.update(remove)
+    if updated_orders is None:
+        # Already gone (e.g. another user deleted it); drop the grid row too
+        return {"remove": [{"id": pending_id}]}, no_update, None
 
     # Broadcast to other clients
     socketio.emit("blotter_changed", {"action": "deleted"}, to="/")
 
-    return _to_blotter_rows(updated_orders), updated_orders, {"display": "none"}, None, True
+    return {"remove": [{"id": pending_id}]}, updated_orders, None
 
 
-@callback(
-    Output("delete-confirm-modal", "style", allow_duplicate=True),
+app.clientside_callback(
+    """
+    function(nClicks) {
+        return nClicks ? null : window.dash_clientside.no_update;
+    }
+    """,
     Output("pending-delete-id", "data", allow_duplicate=True),
     Input("delete-cancel-btn", "n_clicks"),
     prevent_initial_call=True,
 )
-def cancel_delete_order(n_clicks):
-    """Hide the delete confirmation modal."""
-    return {"display": "none"}, None
 
 
 # ---------------------------------------------------------------------------
 # Callback: sync blotter edits (editable cells) + PnL auto-calc
 # ---------------------------------------------------------------------------
 
+_BLOTTER_EDITABLE_FIELDS = ("side", "size", "traded", "bought_sold", "traded_price", "initiator")
+
+
 @callback(
     Output("order-store", "data", allow_duplicate=True),
-    Output("blotter-table", "data", allow_duplicate=True),
-    Output("blotter-edit-suppress", "data", allow_duplicate=True),
-    Input("blotter-table", "data_timestamp"),
-    State("blotter-table", "data"),
-    State("order-store", "data"),
-    State("blotter-edit-suppress", "data"),
+    Output("blotter-table", "rowTransaction", allow_duplicate=True),
+    Input("blotter-table", "cellValueChanged"),
     prevent_initial_call=True,
 )
-def sync_blotter_edits(data_ts, blotter_data, orders, suppress):
-    if suppress:
-        return no_update, no_update, False
-
-    if not blotter_data or not orders:
-        return no_update, no_update, False
-
-    # Build lookup by id
-    order_map = {o["id"]: o for o in orders if "id" in o}
-
-    changed = False
-    editable_fields = ("side", "size", "traded", "bought_sold", "traded_price", "initiator")
-
-    for row in blotter_data:
-        order_id = row.get("id")
-        if not order_id or order_id not in order_map:
-            continue
-
-        stored = order_map[order_id]
-
-        # Sync editable fields from blotter back to store
-        for field in editable_fields:
-            new_val = row.get(field)
+def sync_blotter_edits(changes):
+    if not changes:
+        return no_update, no_update
+    # The grid batches edits into a list; older dash-ag-grid sent one dict
+    if isinstance(changes, dict):
+        changes = [changes]
+
+    editable_fields = _BLOTTER_EDITABLE_FIELDS
+    select_values = _BLOTTER_SELECT_VALUES
+    touched: dict[str, dict] = {}  # order id -> order whose row goes back
+
+    def apply_edits(orders):
+        # Resolve each edit by order id against the saver's newest list, so a
+        # resync, delete or add that landed since the edit can't misdirect it
+        by_id = {o["id"]: o for o in orders if "id" in o}
+        dirty = {}
+        for change in changes:
+            field = change.get("colId")
+            if field not in editable_fields:
+                continue
+            order_id = change.get("rowId")
+            stored = by_id.get(order_id)
+            if stored is None:
+                continue
+            new_val = change.get("value")
+            if field in select_values and new_val not in select_values[field]:
+                # Not one of the column's choices: keep the stored value and
+                # send the row back so the grid cell snaps to it
+                touched[order_id] = stored
+                continue
             if new_val != stored.get(field):
                 stored[field] = new_val
-                changed = True
-
-        # PnL only relevant for traded orders
-        if (stored.get("traded") == "Yes"
-                and stored.get("traded_price") not in (None, "")
-                and stored.get("bought_sold") in ("Bought", "Sold")):
-            try:
-                mid = float(stored.get("mid", 0))
-                tp = float(stored["traded_price"])
-                sz = int(stored.get("size", 0))
-                mult = stored.get("multiplier", 100)
-                if stored["bought_sold"] == "Bought":
-                    pnl = (mid - tp) * sz * mult
-                else:
-                    pnl = (tp - mid) * sz * mult
-                pnl_str = f"{pnl:+,.0f}"
-            except (ValueError, TypeError):
-                pnl_str = ""
-            if stored.get("pnl") != pnl_str:
-                stored["pnl"] = pnl_str
-                changed = True
-        elif stored.get("traded") != "Yes" and stored.get("pnl") not in (None, ""):
-            stored["pnl"] = ""
-            changed = True
-
-    if not changed:
-        return no_update, no_update, False
-
-    updated_orders = list(order_map.values())
-
-    # Persist to SQLite
-    store_save_orders(updated_orders)
+                dirty[order_id] = touched[order_id] = stored
+
+        for stored in dirty.values():
+            # PnL only relevant for traded orders
+            if (stored.get("traded") == "Yes"
+                    and stored.get("traded_price") not in (None, "")
+                    and stored.get("bought_sold") in ("Bought", "Sold")):
+                try:
+                    mid = float(stored.get("mid", 0))
+                    tp = float(stored["traded_price"])
+                    sz = int(stored.get("size", 0))
+                    mult = stored.get("multiplier", 100)
+                    if stored["bought_sold"] == "Bought":
+                        pnl = (mid - tp) * sz * mult
+                    else:
+                        pnl = (tp - mid) * sz * mult
+                    stored["pnl"] = f"{pnl:+,.0f}"
+                except (ValueError, TypeError):
+                    stored["pnl"] = ""
+            elif stored.get("traded") != "Yes":
+                stored["pnl"] = ""
+        return bool(dirty)
+
+    # Persist to SQLite (debounced, off the callback thread)
+    orders = _order_saver.update(apply_edits)
+    if not touched:
+        return no_update, no_update
+
+    # Rows go back keyed by order id (the grid's getRowId); the edited cells
+    # too, so the grid's rowData holds the edit, not just its row model
+    transaction = {"update": _to_blotter_rows(list(touched.values()))}
+    if orders is None:
+        return no_update, transaction
 
     # Broadcast to other clients via WebSocket
     socketio.emit("blotter_changed", {"action": "updated"}, to="/")
 
-    return updated_orders, _to_blotter_rows(updated_orders), True
-
-
-# ---------------------------------------------------------------------------
-# Callback: toggle column panel visibility
-# ---------------------------------------------------------------------------
-
-@callback(
-    Output("column-toggle-panel", "style"),
-    Input("column-toggle-btn", "n_clicks"),
-    State("column-toggle-panel", "style"),
-    prevent_initial_call=True,
-)
-def toggle_column_panel(n_clicks, current_style):
-    if current_style.get("display") == "none":
-        return {"display": "block"}
-    return {"display": "none"}
+    return orders, transaction
 
 
 # ---------------------------------------------------------------------------
 # Callback: update visible blotter columns
 # ---------------------------------------------------------------------------
 
-@callback(
-    Output("blotter-table", "columns"),
+# The column defs are constants, so they ship once as JSON inside the
+# function and the toggle just filters them in the browser.
+app.clientside_callback(
+    """
+    function(selected) {
+        var defs = %s;
+        var keep = new Set(selected || []);
+        // Delete column is always shown
+        return [[defs[0]].concat(defs.slice(1).filter(function(d) {
+            return keep.has(d.field);
+        })), selected];
+    }
+    """ % json.dumps(_BLOTTER_COLUMN_DEFS),
+    Output("blotter-table", "columnDefs"),
     Output("visible-columns", "data"),
     Input("column-checklist", "value"),
     prevent_initial_call=True,
 )
-def update_visible_columns(selected_columns):
-    # Always include the delete column first, then user-selected columns
-    visible = [_BLOTTER_COLUMNS[0]] + [
-        c for c in _BLOTTER_COLUMNS[1:] if c["id"] in selected_columns
-    ]
-    return visible, selected_columns
 
 
 # ---------------------------------------------------------------------------
 # Callback: recall order from blotter into pricer
 # ---------------------------------------------------------------------------
 
-@callback(
+# Pure store -> inputs copy, so it runs in the browser. Style constants are
+# injected from Python to keep them in one place.
+_RECALL_JS = """
+    function(cell, orders) {
+        // Shared miss-path result; Dash only reads it
+        if (!window._recallNoop) {
+            window._recallNoop = new Array(13).fill(window.dash_clientside.no_update);
+        }
+        var noop = window._recallNoop;
+
+        if (!cell || !orders || !orders.length) return noop;
+        // Ignore clicks on the delete column (handled by show_delete_modal)
+        if (cell.colId === "delete") return noop;
+
+        // rowId is the order id (getRowId), stable across sorting and paging
+        var clickedId = cell.rowId;
+        if (!clickedId) return noop;
+
+        // id -> order index, rebuilt only when the order-store value changes
+        if (window._recallIndexSrc !== orders) {
+            var index = {};
+            for (var j = 0; j < orders.length; j++) {
+                if (orders[j].id) index[orders[j].id] = orders[j];
+            }
+            window._recallIndex = index;
+            window._recallIndexSrc = orders;
+        }
+        var order = window._recallIndex[clickedId];
+        if (!order) return noop;
+
+        var tableData = order._table_data;
+        if (!tableData || !tableData.length) return noop;
+
+        var S = %s;
+        var span = function(text, style) {
+            return {namespace: "dash_html_components", type: "Span",
+                    props: {children: text, style: style}};
+        };
+        var val = function(v) { return v === undefined ? null : v; };
+
+        var current = val(order._current_structure);
+        var headerStyle = S.hidden, headerItems = [];
+        var brokerStyle = S.hidden, brokerContent = [];
+        var orderInputStyle = S.hidden;
+
+        if (current) {
+            headerItems = [span(current.underlying + " " + current.structure_name, S.title)];
+            headerStyle = S.header;
+            orderInputStyle = S.orderInput;
+
+            var bq = order._broker_quote;
+            if (bq === undefined) {  // orders saved before _broker_quote existed
+                var px = parseFloat(order._broker_price);
+                bq = px > 0 ? [px, (order._quote_side || "bid").toUpperCase()] : null;
+            }
+            if (bq) {
+                var brokerPx = bq[0], quoteSide = bq[1];
+                var mid = current.mid;
+                var edge = brokerPx - mid;
+                brokerContent = [
+                    span("Broker: " + brokerPx.toFixed(2) + " " + quoteSide, S.brokerText),
+                    span("Screen Mid: " + mid.toFixed(2), S.brokerText),
+                    span("Edge: " + (edge >= 0 ? "+" : "") + edge.toFixed(2),
+                         edge > 0 ? S.edgePos : S.edgeNeg),
+                ];
+                brokerStyle = S.broker;
+            }
+        }
+
+        return [
+            tableData,
+            val(order._underlying),
+            val(order._structure_type),
+            val(order._stock_ref),
+            val(order._delta),
+            val(order._broker_price),
+            val(order._quote_side),
+            val(order._quantity),
+            {                       // pricer-snapshot (fanned out to the panels)
+                header_style: headerStyle,
+                header_items: headerItems,
+                broker_style: brokerStyle,
+                broker_content: brokerContent,
+                order_input_style: orderInputStyle,
+            },
+            current,
+            true,   // suppress-template
+            true,   // auto-price-suppress
+            null,   // auto-price-sig
+        ];
+    }
+""" % json.dumps({
+    "hidden": _HIDDEN,
+    "header": _HEADER_VISIBLE_STYLE,
+    "title": _HEADER_TITLE_STYLE,
+    "broker": _BROKER_VISIBLE_STYLE,
+    "brokerText": _BROKER_TEXT_STYLE,
+    "edgePos": _EDGE_POSITIVE_STYLE,
+    "edgeNeg": _EDGE_NEGATIVE_STYLE,
+    "orderInput": _ORDER_INPUT_VISIBLE_STYLE,
+})
+
+app.clientside_callback(
+    _RECALL_JS,
     Output("pricing-display", "data", allow_duplicate=True),
     Output("manual-underlying", "value", allow_duplicate=True),
     Output("manual-structure-type", "value", allow_duplicate=True),
@@ -1264,103 +1658,15 @@ def update_visible_columns(selected_columns):
     Output("manual-broker-price", "value", allow_duplicate=True),
     Output("manual-quote-side", "value", allow_duplicate=True),
     Output("manual-quantity", "value", allow_duplicate=True),
-    Output("order-header", "style", allow_duplicate=True),
-    Output("order-header-content", "children", allow_duplicate=True),
-    Output("broker-quote-section", "style", allow_duplicate=True),
-    Output("broker-quote-content", "children", allow_duplicate=True),
+    Output("pricer-snapshot", "data", allow_duplicate=True),
     Output("current-structure", "data", allow_duplicate=True),
-    Output("order-input-section", "style", allow_duplicate=True),
     Output("suppress-template", "data", allow_duplicate=True),
     Output("auto-price-suppress", "data", allow_duplicate=True),
-    Input("blotter-table", "active_cell"),
-    State("blotter-table", "data"),
+    Output("auto-price-sig", "data", allow_duplicate=True),
+    Input("blotter-table", "cellClicked"),
     State("order-store", "data"),
     prevent_initial_call=True,
 )
-def recall_order(active_cell, blotter_data, orders):
-    if not active_cell or not orders or not blotter_data:
-        return (no_update,) * 16
-
-    # Ignore clicks on the delete column (handled by show_delete_modal)
-    if active_cell.get("column_id") == "delete":
-        return (no_update,) * 16
-
-    row_idx = active_cell["row"]
-    if row_idx >= len(blotter_data):
-        return (no_update,) * 16
-
-    # Get the order id from the displayed row (handles sorted tables)
-    clicked_id = blotter_data[row_idx].get("id")
-    if not clicked_id:
-        return (no_update,) * 16
-
-    # Find the full order in the store by id
-    order = next((o for o in orders if o.get("id") == clicked_id), None)
-    if not order:
-        return (no_update,) * 16
-
-    table_data = order.get("_table_data")
-    if not table_data:
-        return (no_update,) * 16
-
-    current_data = order.get("_current_structure")
-
-    header_style = _HIDDEN
-    header_items = []
-    broker_style = _HIDDEN
-    broker_content = []
-    order_input_style = _HIDDEN
-
-    if current_data:
-        header_items = [
-            html.Span(
-                f"{current_data['underlying']} {current_data['structure_name']}",
-                style={"color": COLORS["text_accent"], "fontWeight": "bold", "fontSize": "17px"},
-            ),
-        ]
-        header_style = _HEADER_VISIBLE_STYLE
-        order_input_style = _ORDER_INPUT_VISIBLE_STYLE
-
-        broker_px = order.get("_broker_price")
-        if broker_px and float(broker_px) > 0:
-            quote_side = (order.get("_quote_side") or "bid").upper()
-            mid = current_data["mid"]
-            edge = float(broker_px) - mid
-            edge_color = COLORS["positive"] if edge > 0 else COLORS["negative"]
-            broker_content = [
-                html.Span(
-                    f"Broker: {float(broker_px):.2f} {quote_side}",
-                    style={"fontSize": "16px", "marginRight": "30px"},
-                ),
-                html.Span(
-                    f"Screen Mid: {mid:.2f}",
-                    style={"fontSize": "16px", "marginRight": "30px"},
-                ),
-                html.Span(
-                    f"Edge: {edge:+.2f}",
-                    style={"fontSize": "16px", "color": edge_color, "fontWeight": "bold"},
-                ),
-            ]
-            broker_style = _BROKER_VISIBLE_STYLE
-
-    return (
-        table_data,
-        order.get("_underlying"),
-        order.get("_structure_type"),
-        order.get("_stock_ref"),
-        order.get("_delta"),
-        order.get("_broker_price"),
-        order.get("_quote_side"),
-        order.get("_quantity"),
-        header_style,
-        header_items,
-        broker_style,
-        broker_content,
-        current_data,
-        order_input_style,
-        True,   # suppress-template
-        True,   # auto-price-suppress
-    )
 
 
 # ---------------------------------------------------------------------------
@@ -1384,7 +1690,7 @@ def submit_username(n_clicks, username_input, existing_user):
 
     # +1 because this user's WebSocket register hasn't fired yet
     count = len(_connected_users) + (1 if not existing_user else 0)
-    return {"display": "none"}, name, "", f"{count} online"
+    return _HIDDEN, name, "", f"{count} online"
 
 
 # ---------------------------------------------------------------------------
@@ -1408,29 +1714,28 @@ app.clientside_callback(
 
 
 # ---------------------------------------------------------------------------
-# Callback: poll for blotter updates from other users
+# Callback: refresh the blotter when another user changes it
 # ---------------------------------------------------------------------------
 
 @callback(
-    Output("blotter-table", "data", allow_duplicate=True),
+    Output("blotter-table", "rowData", allow_duplicate=True),
     Output("order-store", "data", allow_duplicate=True),
-    Output("blotter-edit-suppress", "data", allow_duplicate=True),
-    Input("blotter-poll", "n_intervals"),
+    Input("ws-blotter-refresh", "data"),
+    Input("blotter-resync", "n_intervals"),
     State("order-store", "data"),
     prevent_initial_call=True,
 )
-def poll_blotter_updates(n_intervals, current_orders):
-    """Periodically reload orders from SQLite to pick up changes from other users."""
+def poll_blotter_updates(ws_refresh, n_intervals, current_orders):
+    """Reload orders from SQLite on a blotter_changed push (or the slow resync)."""
+    # Make sure our own pending writes land before reading back
+    _order_saver.flush()
     fresh_orders = store_load_orders()
 
-    # Quick check: if order count hasn't changed and IDs match, skip update
-    current_ids = {o.get("id") for o in (current_orders or [])}
-    fresh_ids = {o.get("id") for o in fresh_orders}
-    if current_ids == fresh_ids and len(current_orders or []) == len(fresh_orders):
-        # Also check if any data changed (compare serialized form)
-        return no_update, no_update, no_update
+    # A push also reaches the client that made the change; skip if in sync
+    if fresh_orders == current_orders:
+        return no_update, no_update
 
-    return _to_blotter_rows(fresh_orders), fresh_orders, True
+    return _to_blotter_rows(fresh_orders), fresh_orders
 
 
 # ---------------------------------------------------------------------------
@@ -1439,7 +1744,7 @@ def poll_blotter_updates(n_intervals, current_orders):
 
 @callback(
     Output("online-count", "children"),
-    Input("blotter-poll", "n_intervals"),
+    Input("blotter-resync", "n_intervals"),
     State("current-user", "data"),
     prevent_initial_call=True,
 )
@@ -1462,7 +1767,7 @@ def update_online_count(n_intervals, current_user):
     prevent_initial_call=True,
 )
 def change_username(n_clicks, current_user):
-    return _MODAL_OVERLAY_STYLE, current_user or ""
+    return _CLASS_SHOWN, current_user or ""
 
 
 # ---------------------------------------------------------------------------
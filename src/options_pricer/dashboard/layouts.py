@@ -1,15 +1,22 @@
 """Dashboard layout components for IDB options pricer."""
 
+import functools
+import json
+import operator
+import re
+from pathlib import Path
+from types import MappingProxyType
+
+import dash_ag_grid as dag
 from dash import dcc, html, dash_table
 
-from ..order_store import load_orders
-from ..settings import BRIDGE_DEFAULT_PORT
+from ..settings import BLOTTER_PAGE_SIZE, BLOTTER_RESYNC_MS, BRIDGE_DEFAULT_PORT
 
 # ---------------------------------------------------------------------------
 # Theme palette — refined dark trading terminal
 # ---------------------------------------------------------------------------
 
-COLORS = {
+COLORS = MappingProxyType({
     # Backgrounds (layered depth)
     "bg_page": "#0a0e1a",
     "bg_card": "#111827",
@@ -17,7 +24,9 @@ COLORS = {
     "bg_input_editable": "#1e2a42",
     "bg_active_row": "#1a3352",
     "bg_structure_row": "#0c2d4e",
-    "bg_modal_overlay": "rgba(4, 6, 14, 0.92)",
+    # Near-opaque instead of a backdrop-filter blur, which repaints the whole
+    # viewport every frame the overlay is up
+    "bg_modal_overlay": "rgba(4, 6, 14, 0.97)",
     "bg_hover": "#162033",
     "bg_toolbar": "#131b2e",
 
@@ -45,7 +54,7 @@ COLORS = {
     "btn_danger_border": "#991b1b",
     "btn_neutral": "#1e293b",
     "btn_neutral_border": "#334155",
-}
+})
 
 # ---------------------------------------------------------------------------
 # Reusable styles
@@ -95,17 +104,126 @@ _BTN_BASE = {
     "letterSpacing": "0.02em",
 }
 
-_BTN_NEUTRAL_SM = {
-    **_BTN_BASE,
-    "padding": "5px 14px",
-    "fontSize": "12px",
+_BTN_PRIMARY = {"backgroundColor": COLORS["btn_primary"], "color": "white"}
+_BTN_SUCCESS = {"backgroundColor": COLORS["btn_success"], "color": "white"}
+_BTN_NEUTRAL = {
     "backgroundColor": COLORS["btn_neutral"],
     "color": COLORS["text_muted"],
     "border": f"1px solid {COLORS['btn_neutral_border']}",
 }
+_BTN_DANGER = {
+    "backgroundColor": COLORS["btn_danger"],
+    "color": COLORS["text_primary"],
+    "border": f"1px solid {COLORS['btn_danger_border']}",
+}
+_BTN_SM = {"padding": "5px 14px", "fontSize": "12px"}
+
+_ERROR_TEXT_STYLE = {
+    "color": COLORS["negative"],
+    "fontFamily": _FONT_MONO,
+    "fontSize": "13px",
+}
+
+# Pricing table (DataTable) styles; the blotter grid takes the same colours
+# through _BLOTTER_THEME_PARAMS
+_TABLE_HEADER_STYLE = {
+    "backgroundColor": COLORS["bg_toolbar"],
+    "color": COLORS["text_muted"],
+    "fontFamily": _FONT_SANS,
+    "fontWeight": "600",
+    "fontSize": "11px",
+    "letterSpacing": "0.05em",
+    "textTransform": "uppercase",
+    "borderBottom": f"1px solid {COLORS['border_light']}",
+}
+
+_TABLE_DATA_STYLE = {
+    "backgroundColor": COLORS["bg_input"],
+    "color": COLORS["text_primary"],
+    "borderBottom": f"1px solid {COLORS['border']}",
+}
+
+_TABLE_STYLE = {"overflowX": "auto", "overflowY": "visible"}
+
+_TABLE_STYLE_CELL = {
+    "textAlign": "center",
+    "fontFamily": _FONT_MONO,
+    "fontSize": "13px",
+    "border": "none",
+    "overflow": "visible",
+}
+
+_DIVIDER_STYLE = {
+    "height": "1px",
+    "background": f"linear-gradient(90deg, transparent, {COLORS['border_light']}, transparent)",
+}
+
+# Full-screen modal backdrop: near-opaque instead of a backdrop-filter blur
+_MODAL_OVERLAY_STYLE = {
+    "position": "fixed",
+    "top": "0",
+    "left": "0",
+    "width": "100vw",
+    "height": "100vh",
+    "backgroundColor": COLORS["bg_modal_overlay"],
+    "display": "flex",
+    "justifyContent": "center",
+    "alignItems": "center",
+    "zIndex": "9999",
+}
+
+# The static base styles above reach the browser once, as classes in the
+# page-head stylesheet (_class_stylesheet), instead of inline on every
+# element in the layout JSON. Order matters: later classes win ties, so
+# variants follow the base. Inline style= only carries per-element extras.
+_STYLE_CLASSES = {
+    "field-label": _LABEL_STYLE,
+    "field-input": _INPUT_STYLE,
+    "error-text": _ERROR_TEXT_STYLE,
+    "btn": _BTN_BASE,
+    "btn-primary": _BTN_PRIMARY,
+    "btn-success": _BTN_SUCCESS,
+    "btn-neutral": _BTN_NEUTRAL,
+    "btn-danger": _BTN_DANGER,
+    "btn-sm": _BTN_SM,
+    "modal-overlay": _MODAL_OVERLAY_STYLE,
+    "divider": _DIVIDER_STYLE,
+}
+
+_CSS_PROP_RE = re.compile(r"[A-Z]")
+
+
+def _css_rule(selector: str, style) -> str:
+    """One stylesheet rule from a React-style dict (camelCase -> kebab-case)."""
+    return (
+        f"{selector} {{ "
+        + " ".join(
+            f"{_CSS_PROP_RE.sub(lambda m: '-' + m.group().lower(), k)}: {v};"
+            for k, v in style.items()
+        )
+        + " }"
+    )
 
-# CSS rules for DataTable dropdown cells
-_TABLE_DROPDOWN_CSS = [
+
+def _class_stylesheet() -> str:
+    """Render _STYLE_CLASSES and the blotter cell classes as stylesheet text."""
+    return "\n".join(
+        [_css_rule(f".{name}", style) for name, style in _STYLE_CLASSES.items()]
+        + [
+            _css_rule(f".ag-cell.{name}", style)
+            for name, style in _BLOTTER_CELL_CLASSES.items()
+        ]
+    )
+
+
+# These dicts are shared across components -- extend with _FOO | {...},
+# never mutate.
+# Lookup-only tables are MappingProxyType / tuples; anything handed to a
+# component prop stays a plain dict, since Dash's encoder rejects proxies.
+
+# CSS rules for DataTable dropdown cells. Served once as a <style> block in
+# the page head (_table_dropdown_stylesheet) rather than per-table css props.
+_TABLE_DROPDOWN_CSS = (
     {
         "selector": ".Select-value-label",
         "rule": f"color: {COLORS['text_primary']} !important; font-family: {_FONT_MONO} !important;",
@@ -164,9 +282,21 @@ _TABLE_DROPDOWN_CSS = [
         "selector": ".dash-cell",
         "rule": "overflow: visible !important;",
     },
-]
+)
+
 
-STRUCTURE_TYPE_OPTIONS = [
+def _table_dropdown_stylesheet(table_ids=("pricing-display",)) -> str:
+    """Render _TABLE_DROPDOWN_CSS as stylesheet text for the given DataTables.
+
+    Rules are prefixed with ``#<table id>`` exactly as the DataTable css prop
+    would scope them, so specificity is unchanged.
+    """
+    return "\n".join(
+        ", ".join(f"#{tid} {r['selector']}" for tid in table_ids) + f" {{ {r['rule']} }}"
+        for r in _TABLE_DROPDOWN_CSS
+    )
+
+STRUCTURE_TYPE_OPTIONS = (
     {"label": "Single", "value": "single"},
     {"label": "Put Spread", "value": "put_spread"},
     {"label": "Call Spread", "value": "call_spread"},
@@ -176,97 +306,211 @@ STRUCTURE_TYPE_OPTIONS = [
     {"label": "Butterfly", "value": "butterfly"},
     {"label": "Iron Condor", "value": "iron_condor"},
     {"label": "Collar", "value": "collar"},
-]
+)
 
 # Empty leg row template
-_EMPTY_ROW = {
+_EMPTY_ROW = MappingProxyType({
     "leg": "", "expiry": "", "strike": "", "type": "", "side": "",
     "qty": 1, "bid_size": "", "bid": "", "mid": "", "offer": "", "offer_size": "",
-}
+})
 
 
-def _make_empty_rows(n: int = 2) -> list[dict]:
-    """Create n empty leg rows with Leg labels."""
-    return [{**_EMPTY_ROW, "leg": f"Leg {i + 1}"} for i in range(n)]
+@functools.lru_cache(maxsize=16)
+def _make_empty_rows(n: int = 2) -> tuple[dict, ...]:
+    """Create n empty leg rows with Leg labels.
+
+    Cached and shared: callers only hand these to Dash for serialization.
+    Copy with list(map(dict, ...)) before mutating.
+    """
+    return tuple(_EMPTY_ROW | {"leg": f"Leg {i + 1}"} for i in range(n))
+
+
+# Non-underscore fields of an order record (see add_order in app.py) — the
+# underscore fields hold recall state and never reach the blotter.
+_BLOTTER_ROW_KEYS = (
+    "id", "added_time", "created_by", "underlying", "structure",
+    "bid_size", "bid", "mid", "offer", "offer_size",
+    "side", "size", "traded", "bought_sold", "traded_price", "initiator",
+    "pnl", "multiplier",
+)
+
+
+# Leading character of a formatted PnL ("+1,250" / "-300") -> row flag the
+# blotter's conditional styles match on with plain equality
+_PNL_SIGN = MappingProxyType({"+": "pos", "-": "neg"})
+
+
+_BLOTTER_ROW_GETTER = operator.itemgetter(*_BLOTTER_ROW_KEYS)
+_BLOTTER_PNL_POS = _BLOTTER_ROW_KEYS.index("pnl")
+
+
+def _pnl_sign(pnl) -> str:
+    """"pos" / "neg" / "" from a formatted PnL string."""
+    return _PNL_SIGN.get((pnl or "")[:1], "")
 
 
 def _to_blotter_rows(orders: list[dict]) -> list[dict]:
-    """Convert order store list to display rows (strip _ fields, add delete icon)."""
-    return [
-        {"delete": "\u2715", **{k: v for k, v in o.items() if not k.startswith("_")}}
-        for o in orders
-    ]
+    """Convert order store list to display rows (strip _ fields, flag PnL sign).
+
+    One comprehension over C-level itemgetter/zip; the delete icon is a
+    column valueGetter, not a per-row field.
+    """
+    keys, pnl_pos, sign = _BLOTTER_ROW_KEYS, _BLOTTER_PNL_POS, _pnl_sign
+    try:
+        return [
+            dict(zip(keys, vals), pnl_sign=sign(vals[pnl_pos]))
+            for vals in map(_BLOTTER_ROW_GETTER, orders)
+        ]
+    except KeyError:
+        # Older records can predate a field; keep whatever they have
+        return [
+            {k: o[k] for k in keys if k in o} | {"pnl_sign": sign(o.get("pnl"))}
+            for o in orders
+        ]
 
 
 # ---------------------------------------------------------------------------
-# Order Blotter column definitions
+# Column definitions
 # ---------------------------------------------------------------------------
 
-_BLOTTER_COLUMNS = [
-    {"name": "", "id": "delete", "editable": False},
-    {"name": "Time", "id": "added_time", "editable": False},
-    {"name": "User", "id": "created_by", "editable": False},
-    {"name": "Underlying", "id": "underlying", "editable": False},
-    {"name": "Structure", "id": "structure", "editable": False},
-    {"name": "Bid", "id": "bid", "editable": False},
-    {"name": "Mid", "id": "mid", "editable": False},
-    {"name": "Offer", "id": "offer", "editable": False},
-    {"name": "Bid Size", "id": "bid_size", "editable": False},
-    {"name": "Offer Size", "id": "offer_size", "editable": False},
-    {"name": "Bid/Offered", "id": "side", "editable": True, "presentation": "dropdown"},
-    {"name": "Size", "id": "size", "editable": True},
-    {"name": "Traded", "id": "traded", "editable": True, "presentation": "dropdown"},
-    {"name": "Bought/Sold", "id": "bought_sold", "editable": True, "presentation": "dropdown"},
-    {"name": "Traded Px", "id": "traded_price", "editable": True},
-    {"name": "Initiator", "id": "initiator", "editable": True},
-    {"name": "PnL", "id": "pnl", "editable": False},
-]
-
-_DEFAULT_VISIBLE = [
+def _col(id_: str, name: str, *, editable: bool = False,
+         numeric: bool = False, dropdown: bool = False) -> dict:
+    """Minimal DataTable column dict -- optional keys only when set.
+
+    Neither table sets editable=True at table level, so a column without
+    an "editable" key is read-only.
+    """
+    col = {"id": id_, "name": name}
+    if editable:
+        col["editable"] = True
+    if numeric:
+        col["type"] = "numeric"
+    if dropdown:
+        col["presentation"] = "dropdown"
+    return col
+
+
+# Pricing table: editable leg inputs, then screen-market outputs
+_PRICING_COLUMNS = (
+    _col("leg", "Leg"),
+    _col("expiry", "Expiry", editable=True),
+    _col("strike", "Strike", editable=True, numeric=True),
+    _col("type", "Type", editable=True, dropdown=True),
+    _col("side", "Side", editable=True, dropdown=True),
+    _col("qty", "Qty", editable=True, numeric=True),
+    _col("bid_size", "Bid Size"),
+    _col("bid", "Bid"),
+    _col("mid", "Mid"),
+    _col("offer", "Offer"),
+    _col("offer_size", "Offer Size"),
+)
+
+# Order blotter
+_BLOTTER_COLUMNS = (
+    _col("delete", ""),
+    _col("added_time", "Time"),
+    _col("created_by", "User"),
+    _col("underlying", "Underlying"),
+    _col("structure", "Structure"),
+    _col("bid", "Bid"),
+    _col("mid", "Mid"),
+    _col("offer", "Offer"),
+    _col("bid_size", "Bid Size"),
+    _col("offer_size", "Offer Size"),
+    _col("side", "Bid/Offered", editable=True, dropdown=True),
+    _col("size", "Size", editable=True),
+    _col("traded", "Traded", editable=True, dropdown=True),
+    _col("bought_sold", "Bought/Sold", editable=True, dropdown=True),
+    _col("traded_price", "Traded Px", editable=True),
+    _col("initiator", "Initiator", editable=True),
+    _col("pnl", "PnL"),
+)
+
+_DEFAULT_VISIBLE = (
     "delete", "added_time", "created_by", "underlying", "structure", "bid", "mid", "offer",
     "side", "size", "traded", "traded_price", "initiator", "pnl",
-]
+)
+
+_DEFAULT_HIDDEN = ("bid_size", "offer_size", "bought_sold")
 
-_DEFAULT_HIDDEN = ["bid_size", "offer_size", "bought_sold"]
+# Column-toggle checklist choices (the delete column can't be hidden)
+_COLUMN_CHECKLIST_OPTIONS = tuple(
+    {"label": c["name"], "value": c["id"]}
+    for c in _BLOTTER_COLUMNS
+    if c["id"] != "delete"
+)
 
 
 # ---------------------------------------------------------------------------
-# Google Fonts link tag for web fonts
+# Web fonts — self-hosted from assets/fonts, Google Fonts as fallback
 # ---------------------------------------------------------------------------
 
-def _google_fonts_link():
-    """Return a link element to load Inter + JetBrains Mono from Google Fonts."""
-    return html.Link(
-        rel="stylesheet",
-        href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&family=JetBrains+Mono:wght@400;500;600;700&display=swap",
+# Latin-subset variable WOFF2 files served by Dash from assets/fonts/. With
+# both present the page never leaves the app's origin for fonts; if either is
+# missing (e.g. a checkout without the binaries) we fall back to Google.
+_FONTS_DIR = Path(__file__).parent / "assets" / "fonts"
+_FONT_FILES = {
+    "Inter": "Inter-latin.woff2",
+    "JetBrains Mono": "JetBrainsMono-latin.woff2",
+}
+
+# Only the weights the styles use (400 body, 500/600 labels and buttons, 700
+# bold); both families render at all four, so nothing lighter is fetched
+_GOOGLE_FONTS_CSS = (
+    "https://fonts.googleapis.com/css2"
+    "?family=Inter:wght@400;500;600;700"
+    "&family=JetBrains+Mono:wght@400;500;600;700"
+    "&display=swap"
+)
+
+
+def _self_hosted_fonts_head() -> str:
+    """Return preload links + @font-face rules for the vendored WOFF2 files."""
+    links = []
+    faces = []
+    for family, filename in _FONT_FILES.items():
+        url = f"/assets/fonts/{filename}"
+        links.append(f'<link rel="preload" as="font" type="font/woff2" href="{url}" crossorigin>')
+        faces.append(
+            f"@font-face{{font-family:'{family}';font-style:normal;"
+            f"font-weight:400 700;font-display:swap;"
+            f"src:url('{url}') format('woff2');}}"
+        )
+    return "".join(links) + "<style>" + "".join(faces) + "</style>"
+
+
+def _google_fonts_head() -> str:
+    """Return <head> markup that loads Inter + JetBrains Mono without blocking paint.
+
+    Preconnects to both Google origins, preloads the stylesheet and applies it
+    via the media="print" onload swap (html.Link can't carry onload, so this
+    goes into app.index_string rather than the layout).
+    """
+    return (
+        '<link rel="preconnect" href="https://fonts.googleapis.com">'
+        '<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>'
+        f'<link rel="preload" as="style" href="{_GOOGLE_FONTS_CSS}">'
+        f'<link rel="stylesheet" href="{_GOOGLE_FONTS_CSS}" media="print" onload="this.media=\'all\'">'
+        f'<noscript><link rel="stylesheet" href="{_GOOGLE_FONTS_CSS}"></noscript>'
     )
 
 
+def _fonts_head() -> str:
+    """Return the <head> font markup, preferring the self-hosted files."""
+    if all((_FONTS_DIR / f).is_file() for f in _FONT_FILES.values()):
+        return _self_hosted_fonts_head()
+    return _google_fonts_head()
+
+
 # ---------------------------------------------------------------------------
 # Layout components
 # ---------------------------------------------------------------------------
 
-_MODAL_OVERLAY_STYLE = {
-    "position": "fixed",
-    "top": "0",
-    "left": "0",
-    "width": "100vw",
-    "height": "100vh",
-    "backgroundColor": COLORS["bg_modal_overlay"],
-    "backdropFilter": "blur(8px)",
-    "WebkitBackdropFilter": "blur(8px)",
-    "display": "flex",
-    "justifyContent": "center",
-    "alignItems": "center",
-    "zIndex": "9999",
-}
-
-
 def create_username_modal():
     """Full-screen blocking modal for username entry on first load."""
     return html.Div(
         id="username-modal",
-        style=_MODAL_OVERLAY_STYLE,
+        className="modal-overlay",
         children=[
             html.Div(
                 style={
@@ -325,8 +569,8 @@ def create_username_modal():
                         placeholder="Your name",
                         maxLength=20,
                         autoFocus=True,
+                        className="field-input",
                         style={
-                            **_INPUT_STYLE,
                             "width": "100%",
                             "boxSizing": "border-box",
                             "fontSize": "15px",
@@ -342,13 +586,11 @@ def create_username_modal():
                         "Continue",
                         id="username-submit-btn",
                         n_clicks=0,
+                        className="btn btn-primary",
                         style={
-                            **_BTN_BASE,
                             "marginTop": "16px",
                             "padding": "12px 48px",
                             "fontSize": "15px",
-                            "backgroundColor": COLORS["btn_primary"],
-                            "color": "white",
                             "width": "100%",
                             "borderRadius": "10px",
                         },
@@ -470,8 +712,8 @@ def create_header():
                         id="change-user-btn",
                         n_clicks=0,
                         title="Change username",
+                        className="btn",
                         style={
-                            **_BTN_BASE,
                             "padding": "2px 7px",
                             "fontSize": "13px",
                             "backgroundColor": "transparent",
@@ -524,44 +766,36 @@ def create_bbg_settings_panel():
                         },
                         children=[
                             html.Div([
-                                html.Div("Bridge Port", style=_LABEL_STYLE),
+                                html.Div("Bridge Port", className="field-label"),
                                 dcc.Input(
                                     id="bridge-port-input",
                                     type="number",
                                     value=BRIDGE_DEFAULT_PORT,
-                                    style={**_INPUT_STYLE, "width": "90px"},
+                                    className="field-input",
+                                    style={"width": "90px"},
                                 ),
                             ]),
                             html.Div([
-                                html.Div("\u00a0", style=_LABEL_STYLE),
+                                html.Div("\u00a0", className="field-label"),
                                 html.A(
                                     html.Button(
                                         "Download Bridge",
                                         id="bridge-download-btn",
                                         n_clicks=0,
-                                        style={
-                                            **_BTN_BASE,
-                                            "padding": "8px 18px",
-                                            "backgroundColor": COLORS["btn_primary"],
-                                            "color": "white",
-                                        },
+                                        className="btn btn-primary",
+                                        style={"padding": "8px 18px"},
                                     ),
                                     href="/download/bloomberg_bridge.py",
                                 ),
                             ]),
                             html.Div([
-                                html.Div("\u00a0", style=_LABEL_STYLE),
+                                html.Div("\u00a0", className="field-label"),
                                 html.Button(
                                     "Test Connection",
                                     id="bridge-test-btn",
                                     n_clicks=0,
-                                    style={
-                                        **_BTN_BASE,
-                                        "padding": "8px 18px",
-                                        "backgroundColor": COLORS["btn_neutral"],
-                                        "color": COLORS["text_muted"],
-                                        "border": f"1px solid {COLORS['btn_neutral_border']}",
-                                    },
+                                    className="btn btn-neutral",
+                                    style={"padding": "8px 18px"},
                                 ),
                             ]),
                             html.Div(
@@ -636,13 +870,7 @@ def create_bridge_banner():
                             "Download Bridge",
                             id="banner-download-btn",
                             n_clicks=0,
-                            style={
-                                **_BTN_BASE,
-                                "padding": "5px 14px",
-                                "fontSize": "12px",
-                                "backgroundColor": COLORS["btn_primary"],
-                                "color": "white",
-                            },
+                            className="btn btn-primary btn-sm",
                         ),
                         href="/download/bloomberg_bridge.py",
                     ),
@@ -652,6 +880,10 @@ def create_bridge_banner():
     )
 
 
+# Shown as the order box placeholder; app.py also parses it once at import
+_ORDER_EXAMPLE = "AAPL Jun26 240/220 PS 1X2 vs250 15d 500x @ 3.50 1X over"
+
+
 def create_order_input():
     return html.Div(
         className="order-input",
@@ -659,15 +891,15 @@ def create_order_input():
         children=[
             html.Div(
                 "PASTE ORDER",
+                className="field-label",
                 style={
-                    **_LABEL_STYLE,
                     "fontSize": "12px",
                     "marginBottom": "8px",
                 },
             ),
             dcc.Textarea(
                 id="order-text",
-                placeholder='e.g. AAPL Jun26 240/220 PS 1X2 vs250 15d 500x @ 3.50 1X over',
+                placeholder=f"e.g. {_ORDER_EXAMPLE}",
                 style={
                     "width": "100%",
                     "boxSizing": "border-box",
@@ -679,8 +911,12 @@ def create_order_input():
                     "color": COLORS["text_accent"],
                     "border": f"1px solid {COLORS['border_light']}",
                     "borderRadius": "10px",
-                    "minHeight": "70px",
+                    # Browser grows the box with its content (Chromium 123+);
+                    # elsewhere it stays a 70px box that scrolls. Users can
+                    # still drag it taller either way.
+                    "fieldSizing": "content",
                     "resize": "vertical",
+                    "minHeight": "70px",
                     "lineHeight": "1.6",
                     "outline": "none",
                     "transition": "border-color 0.2s ease, box-shadow 0.2s ease",
@@ -700,21 +936,12 @@ def create_order_input():
                         "Parse & Price",
                         id="price-btn",
                         n_clicks=0,
-                        style={
-                            **_BTN_BASE,
-                            "padding": "10px 28px",
-                            "fontSize": "14px",
-                            "backgroundColor": COLORS["btn_primary"],
-                            "color": "white",
-                        },
+                        className="btn btn-primary",
+                        style={"padding": "10px 28px", "fontSize": "14px"},
                     ),
                     html.Div(
                         id="parse-error",
-                        style={
-                            "color": COLORS["negative"],
-                            "fontFamily": _FONT_MONO,
-                            "fontSize": "13px",
-                        },
+                        className="error-text",
                     ),
                 ],
             ),
@@ -722,6 +949,15 @@ def create_order_input():
     )
 
 
+_STRUCTURE_DROPDOWN_STYLE = _DROPDOWN_STYLE | {"width": "160px"}
+_QUOTE_SIDE_DROPDOWN_STYLE = _DROPDOWN_STYLE | {"width": "100px"}
+
+_QUOTE_SIDE_OPTIONS = (
+    {"label": "Bid", "value": "bid"},
+    {"label": "Offer", "value": "offer"},
+)
+
+
 def create_pricer_toolbar():
     """Compact toolbar row with underlying, structure type, order metadata, and Add Order."""
     toolbar_row = html.Div(
@@ -733,79 +969,77 @@ def create_pricer_toolbar():
         },
         children=[
             html.Div([
-                html.Div("Underlying", style=_LABEL_STYLE),
+                html.Div("Underlying", className="field-label"),
                 dcc.Input(
                     id="manual-underlying", type="text",
                     placeholder="e.g. AAPL", debounce=True,
-                    style={**_INPUT_STYLE, "width": "100px", "textTransform": "uppercase"},
+                    className="field-input",
+                    style={"width": "100px", "textTransform": "uppercase"},
                 ),
             ]),
             html.Div([
-                html.Div("Structure", style=_LABEL_STYLE),
+                html.Div("Structure", className="field-label"),
                 dcc.Dropdown(
                     id="manual-structure-type",
                     options=STRUCTURE_TYPE_OPTIONS,
                     placeholder="Select...",
-                    style={**_DROPDOWN_STYLE, "width": "160px"},
+                    style=_STRUCTURE_DROPDOWN_STYLE,
                 ),
             ]),
             html.Div([
-                html.Div("Tie", style=_LABEL_STYLE),
+                html.Div("Tie", className="field-label"),
                 dcc.Input(
                     id="manual-stock-ref", type="number",
                     placeholder="0.00",
-                    style={**_INPUT_STYLE, "width": "90px"},
+                    className="field-input",
+                    style={"width": "90px"},
                 ),
             ]),
             html.Div([
-                html.Div("Delta", style=_LABEL_STYLE),
+                html.Div("Delta", className="field-label"),
                 dcc.Input(
                     id="manual-delta", type="number",
                     placeholder="0",
-                    style={**_INPUT_STYLE, "width": "70px"},
+                    className="field-input",
+                    style={"width": "70px"},
                 ),
             ]),
             html.Div([
-                html.Div("Order Price", style=_LABEL_STYLE),
+                html.Div("Order Price", className="field-label"),
                 dcc.Input(
                     id="manual-broker-price", type="number",
                     placeholder="0.00",
-                    style={**_INPUT_STYLE, "width": "90px"},
+                    className="field-input",
+                    style={"width": "90px"},
                 ),
             ]),
             html.Div([
-                html.Div("Side", style=_LABEL_STYLE),
+                html.Div("Side", className="field-label"),
                 dcc.Dropdown(
                     id="manual-quote-side",
-                    options=[
-                        {"label": "Bid", "value": "bid"},
-                        {"label": "Offer", "value": "offer"},
-                    ],
+                    options=_QUOTE_SIDE_OPTIONS,
                     value=None,
                     placeholder="Side",
-                    style={**_DROPDOWN_STYLE, "width": "100px"},
+                    style=_QUOTE_SIDE_DROPDOWN_STYLE,
                 ),
             ]),
             html.Div([
-                html.Div("Qty", style=_LABEL_STYLE),
+                html.Div("Qty", className="field-label"),
                 dcc.Input(
                     id="manual-quantity", type="number",
                     placeholder="Qty", value=None,
-                    style={**_INPUT_STYLE, "width": "80px"},
+                    className="field-input",
+                    style={"width": "80px"},
                 ),
             ]),
             html.Div([
-                html.Div("\u00a0", style=_LABEL_STYLE),
+                html.Div("\u00a0", className="field-label"),
                 html.Button(
                     "Add Order",
                     id="add-order-btn",
                     n_clicks=0,
-                    style={
-                        **_BTN_BASE,
-                        "padding": "8px 22px",
-                        "backgroundColor": COLORS["btn_success"],
-                        "color": "white",
-                    },
+                    className="btn btn-success",
+                    style={"padding": "8px 22px"},
                 ),
             ]),
         ],
@@ -821,17 +1055,58 @@ def create_pricer_toolbar():
             toolbar_row,
             html.Div(
                 id="order-error",
-                style={
-                    "color": COLORS["negative"],
-                    "fontFamily": _FONT_MONO,
-                    "fontSize": "13px",
-                    "marginTop": "6px",
-                },
+                className="error-text",
+                style={"marginTop": "6px"},
             ),
         ],
     )
 
 
+_PRICING_DROPDOWN = {
+    "type": {
+        "options": (
+            {"label": "Call", "value": "C"},
+            {"label": "Put", "value": "P"},
+        ),
+    },
+    "side": {
+        "options": (
+            {"label": "Buy", "value": "B"},
+            {"label": "Sell", "value": "S"},
+        ),
+    },
+}
+
+_PRICING_STYLE_CELL = _TABLE_STYLE_CELL | {"padding": "10px 12px"}
+_PRICING_STYLE_HEADER = _TABLE_HEADER_STYLE | {"padding": "10px 12px"}
+
+_PRICING_STYLE_CELL_COND = (
+    # Editable columns get a slightly lighter background
+    {
+        "if": {"column_id": ["expiry", "strike", "type", "side", "qty"]},
+        "backgroundColor": COLORS["bg_input_editable"],
+    },
+    # Leg column narrower
+    {"if": {"column_id": "leg"}, "width": "70px"},
+    {"if": {"column_id": "expiry"}, "width": "80px"},
+    {"if": {"column_id": "qty"}, "width": "50px"},
+)
+
+_PRICING_STYLE_DATA_COND = (
+    # Color-coded pricing columns
+    {"if": {"column_id": "bid"}, "color": COLORS["positive"]},
+    {"if": {"column_id": "offer"}, "color": COLORS["offer_col"]},
+    # Structure summary row (last -- overrides column colors)
+    {
+        "if": {"filter_query": '{leg} = "Structure"'},
+        "backgroundColor": COLORS["bg_structure_row"],
+        "fontWeight": "700",
+        "borderTop": f"2px solid {COLORS['text_accent']}",
+        "color": COLORS["text_accent"],
+    },
+)
+
+
 def create_pricing_table():
     """Unified editable pricing table -- input columns + output columns."""
     return html.Div(
@@ -839,87 +1114,15 @@ def create_pricing_table():
         children=[
             dash_table.DataTable(
                 id="pricing-display",
-                columns=[
-                    {"name": "Leg", "id": "leg", "editable": False},
-                    {"name": "Expiry", "id": "expiry", "editable": True},
-                    {"name": "Strike", "id": "strike", "editable": True, "type": "numeric"},
-                    {"name": "Type", "id": "type", "editable": True, "presentation": "dropdown"},
-                    {"name": "Side", "id": "side", "editable": True, "presentation": "dropdown"},
-                    {"name": "Qty", "id": "qty", "editable": True, "type": "numeric"},
-                    {"name": "Bid Size", "id": "bid_size", "editable": False},
-                    {"name": "Bid", "id": "bid", "editable": False},
-                    {"name": "Mid", "id": "mid", "editable": False},
-                    {"name": "Offer", "id": "offer", "editable": False},
-                    {"name": "Offer Size", "id": "offer_size", "editable": False},
-                ],
+                columns=_PRICING_COLUMNS,
                 data=_make_empty_rows(2),
-                dropdown={
-                    "type": {
-                        "options": [
-                            {"label": "Call", "value": "C"},
-                            {"label": "Put", "value": "P"},
-                        ],
-                    },
-                    "side": {
-                        "options": [
-                            {"label": "Buy", "value": "B"},
-                            {"label": "Sell", "value": "S"},
-                        ],
-                    },
-                },
-                css=_TABLE_DROPDOWN_CSS,
-                style_table={
-                    "overflowX": "auto",
-                    "overflowY": "visible",
-                },
-                style_cell={
-                    "textAlign": "center",
-                    "padding": "10px 12px",
-                    "fontFamily": _FONT_MONO,
-                    "fontSize": "13px",
-                    "border": "none",
-                    "overflow": "visible",
-                },
-                style_header={
-                    "backgroundColor": COLORS["bg_toolbar"],
-                    "color": COLORS["text_muted"],
-                    "fontFamily": _FONT_SANS,
-                    "fontWeight": "600",
-                    "fontSize": "11px",
-                    "letterSpacing": "0.05em",
-                    "textTransform": "uppercase",
-                    "borderBottom": f"1px solid {COLORS['border_light']}",
-                    "padding": "10px 12px",
-                },
-                style_data={
-                    "backgroundColor": COLORS["bg_input"],
-                    "color": COLORS["text_primary"],
-                    "borderBottom": f"1px solid {COLORS['border']}",
-                },
-                style_cell_conditional=[
-                    # Editable columns get a slightly lighter background
-                    {
-                        "if": {"column_id": ["expiry", "strike", "type", "side", "qty"]},
-                        "backgroundColor": COLORS["bg_input_editable"],
-                    },
-                    # Leg column narrower
-                    {"if": {"column_id": "leg"}, "width": "70px"},
-                    {"if": {"column_id": "expiry"}, "width": "80px"},
-                    {"if": {"column_id": "qty"}, "width": "50px"},
-                ],
-                style_data_conditional=[
-                    # Color-coded pricing columns
-                    {"if": {"column_id": "bid"}, "color": COLORS["positive"]},
-                    {"if": {"column_id": "offer"}, "color": COLORS["offer_col"]},
-                    # Structure summary row (last -- overrides column colors)
-                    {
-                        "if": {"filter_query": '{leg} = "Structure"'},
-                        "backgroundColor": COLORS["bg_structure_row"],
-                        "fontWeight": "700",
-                        "borderTop": f"2px solid {COLORS['text_accent']}",
-                        "color": COLORS["text_accent"],
-                    },
-                ],
+                dropdown=_PRICING_DROPDOWN,
+                style_table=_TABLE_STYLE,
+                style_cell=_PRICING_STYLE_CELL,
+                style_header=_PRICING_STYLE_HEADER,
+                style_data=_TABLE_DATA_STYLE,
+                style_cell_conditional=_PRICING_STYLE_CELL_COND,
+                style_data_conditional=_PRICING_STYLE_DATA_COND,
             ),
             # Action row below table
             html.Div(
@@ -933,31 +1136,20 @@ def create_pricing_table():
                 children=[
                     html.Button(
                         "+ Row", id="add-row-btn", n_clicks=0,
-                        style=_BTN_NEUTRAL_SM,
+                        className="btn btn-neutral btn-sm",
                     ),
                     html.Button(
                         "- Row", id="remove-row-btn", n_clicks=0,
-                        style=_BTN_NEUTRAL_SM,
+                        className="btn btn-neutral btn-sm",
                     ),
                     html.Button(
                         "Clear", id="clear-btn", n_clicks=0,
-                        style={
-                            **_BTN_BASE,
-                            "padding": "5px 14px",
-                            "fontSize": "12px",
-                            "backgroundColor": COLORS["btn_danger"],
-                            "color": COLORS["text_primary"],
-                            "border": f"1px solid {COLORS['btn_danger_border']}",
-                            "marginLeft": "8px",
-                        },
+                        className="btn btn-danger btn-sm",
+                        style={"marginLeft": "8px"},
                     ),
                     html.Div(
                         id="table-error",
-                        style={
-                            "color": COLORS["negative"],
-                            "fontFamily": _FONT_MONO,
-                            "fontSize": "13px",
-                        },
+                        className="error-text",
                     ),
                 ],
             ),
@@ -1026,337 +1218,340 @@ def create_order_input_section():
     )
 
 
-def create_order_blotter(initial_data=None):
-    """Order blotter table -- library of all priced structures."""
-    visible_cols = [c for c in _BLOTTER_COLUMNS if c["id"] in _DEFAULT_VISIBLE]
+# Page-level styles, merged here once rather than in the function bodies
+_PAGE_STYLE = {
+    "fontFamily": _FONT_SANS,
+    "backgroundColor": COLORS["bg_page"],
+    "color": COLORS["text_primary"],
+    "minHeight": "100vh",
+    "padding": "24px 28px 80px 28px",
+    "width": "100%",
+    "boxSizing": "border-box",
+}
+# Dividers take the gradient from the divider class; only margins are inline
+_DIVIDER_TOP_STYLE = {"margin": "0 0 20px 0"}
+_DIVIDER_BLOTTER_STYLE = {"margin": "24px 0 0 0"}
+_PRICER_CARD_STYLE = {
+    "backgroundColor": COLORS["bg_input"],
+    "borderRadius": "10px",
+    "border": f"1px solid {COLORS['border']}",
+    "overflow": "visible",
+}
+_BLOTTER_WRAPPER_STYLE = {"marginTop": "24px"}
+
+_BLOTTER_TITLE_ROW_STYLE = {
+    "display": "flex",
+    "alignItems": "center",
+    "gap": "12px",
+    "marginBottom": "8px",
+}
+
+_BLOTTER_TITLE_STYLE = {
+    "margin": "0",
+    "fontFamily": _FONT_SANS,
+    "fontWeight": "600",
+    "fontSize": "18px",
+    "color": COLORS["text_heading"],
+    "letterSpacing": "-0.02em",
+}
+
+_BLOTTER_HINT_STYLE = {
+    "color": COLORS["text_hint"],
+    "fontSize": "12px",
+    "fontFamily": _FONT_SANS,
+    "margin": "0 0 10px 0",
+}
+
+_COLUMN_TOGGLE_STYLE = {"position": "relative"}
 
+# Opens as a popover under the Columns summary
+_COLUMN_CHECKLIST_STYLE = {
+    "position": "absolute",
+    "top": "calc(100% + 6px)",
+    "left": "0",
+    "zIndex": "20",
+    "width": "max-content",
+    "maxWidth": "min(640px, 90vw)",
+    "display": "flex",
+    "flexWrap": "wrap",
+    "gap": "10px",
+    "padding": "12px 14px",
+    "backgroundColor": COLORS["bg_card"],
+    "borderRadius": "8px",
+    "border": f"1px solid {COLORS['border']}",
+    "boxShadow": "0 10px 25px -5px rgba(0, 0, 0, 0.5)",
+    "fontFamily": _FONT_MONO,
+    "fontSize": "12px",
+    "color": COLORS["text_muted"],
+}
+
+# Delete confirmation sits just under the username modal; the rest of the
+# overlay comes from the modal-overlay class
+_DELETE_OVERLAY_STYLE = {"zIndex": "9998"}
+
+_DELETE_CARD_STYLE = {
+    "backgroundColor": COLORS["bg_card"],
+    "padding": "32px 36px",
+    "borderRadius": "12px",
+    "border": f"1px solid {COLORS['btn_danger_border']}",
+    "boxShadow": "0 25px 50px -12px rgba(0, 0, 0, 0.6)",
+    "textAlign": "center",
+    "maxWidth": "380px",
+    "width": "90%",
+}
+
+_DELETE_TITLE_STYLE = {
+    "color": COLORS["negative"],
+    "fontFamily": _FONT_SANS,
+    "fontWeight": "600",
+    "fontSize": "18px",
+    "marginBottom": "8px",
+}
+
+_DELETE_DETAIL_STYLE = {
+    "color": COLORS["text_muted"],
+    "fontFamily": _FONT_MONO,
+    "fontSize": "13px",
+    "marginBottom": "24px",
+    "lineHeight": "1.5",
+}
+
+_MODAL_ACTIONS_STYLE = {"display": "flex", "gap": "10px", "justifyContent": "center"}
+_MODAL_BTN_STYLE = {"padding": "10px 28px", "fontSize": "14px"}
+
+
+# Stands in for the order text in _delete_modal_body(); filled in clientside
+_DELETE_DETAIL_SLOT = "__delete_detail__"
+
+
+@functools.lru_cache(maxsize=1)
+def _delete_modal_body():
+    """Delete confirmation overlay, mounted only while a delete is pending."""
     return html.Div(
-        className="order-blotter",
-        style={"marginTop": "24px"},
+        className="modal-overlay",
+        style=_DELETE_OVERLAY_STYLE,
         children=[
-            # Title row with column toggle
             html.Div(
-                style={
-                    "display": "flex",
-                    "alignItems": "center",
-                    "gap": "12px",
-                    "marginBottom": "8px",
-                },
+                style=_DELETE_CARD_STYLE,
                 children=[
-                    html.H3(
-                        "Order Blotter",
-                        style={
-                            "margin": "0",
-                            "fontFamily": _FONT_SANS,
-                            "fontWeight": "600",
-                            "fontSize": "18px",
-                            "color": COLORS["text_heading"],
-                            "letterSpacing": "-0.02em",
-                        },
-                    ),
-                    html.Button(
-                        "Columns",
-                        id="column-toggle-btn",
-                        n_clicks=0,
-                        title="Show/hide blotter columns",
-                        style={
-                            **_BTN_BASE,
-                            "padding": "4px 12px",
-                            "fontSize": "11px",
-                            "backgroundColor": COLORS["btn_neutral"],
-                            "color": COLORS["text_muted"],
-                            "border": f"1px solid {COLORS['btn_neutral_border']}",
-                        },
-                    ),
-                ],
-            ),
-            html.P(
-                "Click a row to recall into pricer. Edit cells directly to update order status.",
-                style={
-                    "color": COLORS["text_hint"],
-                    "fontSize": "12px",
-                    "fontFamily": _FONT_SANS,
-                    "margin": "0 0 10px 0",
-                },
-            ),
-            # Column toggle panel (hidden by default)
-            html.Div(
-                id="column-toggle-panel",
-                style={"display": "none"},
-                children=[
-                    dcc.Checklist(
-                        id="column-checklist",
-                        options=[
-                            {"label": c["name"], "value": c["id"]}
-                            for c in _BLOTTER_COLUMNS
-                            if c["id"] != "delete"
+                    html.Div("Delete Order", style=_DELETE_TITLE_STYLE),
+                    html.Div(_DELETE_DETAIL_SLOT, style=_DELETE_DETAIL_STYLE),
+                    html.Div(
+                        style=_MODAL_ACTIONS_STYLE,
+                        children=[
+                            html.Button(
+                                "Cancel",
+                                id="delete-cancel-btn",
+                                n_clicks=0,
+                                className="btn btn-neutral",
+                                style=_MODAL_BTN_STYLE,
+                            ),
+                            html.Button(
+                                "Delete",
+                                id="delete-confirm-btn",
+                                n_clicks=0,
+                                className="btn btn-danger",
+                                style=_MODAL_BTN_STYLE,
+                            ),
                         ],
-                        value=_DEFAULT_VISIBLE,
-                        style={
-                            "display": "flex",
-                            "flexWrap": "wrap",
-                            "gap": "10px",
-                            "padding": "12px 14px",
-                            "backgroundColor": COLORS["bg_card"],
-                            "borderRadius": "8px",
-                            "border": f"1px solid {COLORS['border']}",
-                            "fontFamily": _FONT_MONO,
-                            "fontSize": "12px",
-                            "color": COLORS["text_muted"],
-                            "marginBottom": "10px",
-                        },
-                        inputStyle={"marginRight": "5px"},
                     ),
                 ],
             ),
-            # Store for visible column IDs
-            dcc.Store(id="visible-columns", data=_DEFAULT_VISIBLE),
-            # Store for pending delete order ID
-            dcc.Store(id="pending-delete-id", data=None),
-            # Delete confirmation modal
+        ],
+    )
+
+
+# Choices for the blotter's select-editor columns
+_BLOTTER_SELECT_VALUES = {
+    "side": ["Bid", "Offered"],
+    "traded": ["Yes", "No"],
+    "bought_sold": ["Bought", "Sold", ""],
+}
+
+_CELL_POSITIVE = {"color": COLORS["positive"], "fontWeight": "600"}
+_CELL_NEGATIVE = {"color": COLORS["negative"], "fontWeight": "600"}
+
+# Per-column value colouring, as {css class: grid condition expression}.
+# The grid only toggles a class on the cell when a rule flips; the colours
+# themselves live once in the page-head stylesheet (_BLOTTER_CELL_CLASSES)
+# instead of a merged inline style object per rendered cell.
+_BLOTTER_CELL_CLASS_RULES = {
+    "side": {
+        "cell-pos": "params.value == 'Bid'",
+        "cell-neg": "params.value == 'Offered'",
+    },
+    "bought_sold": {
+        "cell-pos": "params.value == 'Bought'",
+        "cell-neg": "params.value == 'Sold'",
+    },
+    "pnl": {
+        "cell-pos": "params.data.pnl_sign == 'pos'",
+        "cell-neg": "params.data.pnl_sign == 'neg'",
+    },
+}
+
+# Blotter cell classes, scoped under .ag-cell so they outrank the theme
+_BLOTTER_CELL_CLASSES = {
+    "cell-editable": {"backgroundColor": COLORS["bg_input_editable"]},
+    "cell-pos": _CELL_POSITIVE,
+    "cell-neg": _CELL_NEGATIVE,
+}
+
+# Fixed-width / non-sortable tweaks for individual columns
+_BLOTTER_COL_OVERRIDES = {
+    "delete": {
+        "width": 44,
+        "minWidth": 44,
+        "maxWidth": 44,
+        "sortable": False,
+        "resizable": False,
+        "valueGetter": {"function": "'\u2715'"},
+        "cellStyle": {"textAlign": "center", "color": COLORS["text_hint"], "fontSize": "15px"},
+    },
+    "added_time": {"sort": "desc"},
+    # Rows are fixed-height for virtualization; long names clip, full text on hover
+    "structure": {"minWidth": 160, "tooltipField": "structure"},
+}
+
+
+def _blotter_col_def(col: dict) -> dict:
+    """AG Grid columnDef for one _BLOTTER_COLUMNS entry."""
+    field = col["id"]
+    col_def = {"field": field, "headerName": col["name"]}
+    if col.get("editable"):
+        col_def["editable"] = True
+        col_def["cellClass"] = "cell-editable"
+    if field in _BLOTTER_SELECT_VALUES:
+        col_def["cellEditor"] = "agSelectCellEditor"
+        col_def["cellEditorParams"] = {"values": _BLOTTER_SELECT_VALUES[field]}
+    if field in _BLOTTER_CELL_CLASS_RULES:
+        col_def["cellClassRules"] = _BLOTTER_CELL_CLASS_RULES[field]
+    return col_def | _BLOTTER_COL_OVERRIDES.get(field, {})
+
+
+_BLOTTER_COLUMN_DEFS = tuple(_blotter_col_def(c) for c in _BLOTTER_COLUMNS)
+
+
+def _blotter_visible_col_defs(visible) -> list[dict]:
+    """columnDefs for the given visible column ids (delete column always shown)."""
+    visible = frozenset(visible)
+    return [_BLOTTER_COLUMN_DEFS[0]] + [
+        d for d in _BLOTTER_COLUMN_DEFS[1:] if d["field"] in visible
+    ]
+
+
+# AG Grid theme params mirroring the pricing table's DataTable styles
+_BLOTTER_THEME_PARAMS = {
+    "backgroundColor": COLORS["bg_input"],
+    "foregroundColor": COLORS["text_primary"],
+    "accentColor": COLORS["text_accent"],
+    "borderColor": COLORS["border"],
+    "wrapperBorderRadius": 10,
+    "fontFamily": _FONT_MONO,
+    "fontSize": 13,
+    "headerBackgroundColor": COLORS["bg_toolbar"],
+    "headerTextColor": COLORS["text_muted"],
+    "headerFontFamily": _FONT_SANS,
+    "headerFontSize": 11,
+    "headerFontWeight": 600,
+    "rowHoverColor": COLORS["bg_hover"],
+    "selectedRowBackgroundColor": COLORS["bg_active_row"],
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _blotter_grid_props():
+    """Every blotter AgGrid prop except rowData -- built once, shared read-only."""
+    return dict(
+        id="blotter-table",
+        columnDefs=_blotter_visible_col_defs(_DEFAULT_VISIBLE),
+        defaultColDef={
+            "sortable": True,
+            "resizable": True,
+            "minWidth": 60,
+            "cellStyle": {"textAlign": "center"},
+        },
+        # Rows are keyed by order id, so rowTransaction updates land on the
+        # right row and cellClicked / cellValueChanged carry it as rowId
+        getRowId="params.data.id",
+        columnSize="responsiveSizeToFit",
+        rowStyle={"cursor": "pointer"},
+        # Fixed height keeps row virtualization on: only the rows in view
+        # (plus rowBuffer) are in the DOM, however long the day's blotter.
+        # The grid sits below the fold, so the browser may skip laying out
+        # and painting it until it scrolls near the viewport; its size is
+        # known up front, so nothing shifts when it renders.
+        style={
+            "height": "560px",
+            "width": "100%",
+            "contentVisibility": "auto",
+            "containIntrinsicSize": "auto 560px",
+        },
+        dashGridOptions={
+            "theme": {"function": f"themeAlpine.withParams({json.dumps(_BLOTTER_THEME_PARAMS)})"},
+            "pagination": True,
+            "paginationPageSize": BLOTTER_PAGE_SIZE,
+            "paginationPageSizeSelector": False,
+            "rowBuffer": 20,
+            # Explicit fixed heights: the virtual scroller never measures rows
+            "rowHeight": 38,
+            "headerHeight": 38,
+            "tooltipShowDelay": 300,
+            "animateRows": False,
+            # Row transactions re-sort only the changed rows into the sorted order
+            "deltaSort": True,
+            "singleClickEdit": True,
+            "stopEditingWhenCellsLoseFocus": True,
+        },
+    )
+
+
+def create_order_blotter(initial_data=None):
+    """Order blotter table -- library of all priced structures."""
+    return html.Div(
+        className="order-blotter",
+        style=_BLOTTER_WRAPPER_STYLE,
+        children=[
+            # Title row with column toggle
             html.Div(
-                id="delete-confirm-modal",
-                style={"display": "none"},
+                style=_BLOTTER_TITLE_ROW_STYLE,
                 children=[
-                    html.Div(
-                        style={
-                            "position": "fixed",
-                            "top": "0",
-                            "left": "0",
-                            "width": "100vw",
-                            "height": "100vh",
-                            "backgroundColor": COLORS["bg_modal_overlay"],
-                            "backdropFilter": "blur(4px)",
-                            "WebkitBackdropFilter": "blur(4px)",
-                            "display": "flex",
-                            "justifyContent": "center",
-                            "alignItems": "center",
-                            "zIndex": "9998",
-                        },
+                    html.H3("Order Blotter", style=_BLOTTER_TITLE_STYLE),
+                    # Native <details>: the browser opens/closes the column
+                    # panel, no callback involved
+                    html.Details(
+                        style=_COLUMN_TOGGLE_STYLE,
                         children=[
-                            html.Div(
-                                style={
-                                    "backgroundColor": COLORS["bg_card"],
-                                    "padding": "32px 36px",
-                                    "borderRadius": "12px",
-                                    "border": f"1px solid {COLORS['btn_danger_border']}",
-                                    "boxShadow": "0 25px 50px -12px rgba(0, 0, 0, 0.6)",
-                                    "textAlign": "center",
-                                    "maxWidth": "380px",
-                                    "width": "90%",
-                                },
-                                children=[
-                                    html.Div(
-                                        "Delete Order",
-                                        style={
-                                            "color": COLORS["negative"],
-                                            "fontFamily": _FONT_SANS,
-                                            "fontWeight": "600",
-                                            "fontSize": "18px",
-                                            "marginBottom": "8px",
-                                        },
-                                    ),
-                                    html.Div(
-                                        id="delete-confirm-detail",
-                                        style={
-                                            "color": COLORS["text_muted"],
-                                            "fontFamily": _FONT_MONO,
-                                            "fontSize": "13px",
-                                            "marginBottom": "24px",
-                                            "lineHeight": "1.5",
-                                        },
-                                    ),
-                                    html.Div(
-                                        style={
-                                            "display": "flex",
-                                            "gap": "10px",
-                                            "justifyContent": "center",
-                                        },
-                                        children=[
-                                            html.Button(
-                                                "Cancel",
-                                                id="delete-cancel-btn",
-                                                n_clicks=0,
-                                                style={
-                                                    **_BTN_BASE,
-                                                    "padding": "10px 28px",
-                                                    "fontSize": "14px",
-                                                    "backgroundColor": COLORS["btn_neutral"],
-                                                    "color": COLORS["text_muted"],
-                                                    "border": f"1px solid {COLORS['btn_neutral_border']}",
-                                                },
-                                            ),
-                                            html.Button(
-                                                "Delete",
-                                                id="delete-confirm-btn",
-                                                n_clicks=0,
-                                                style={
-                                                    **_BTN_BASE,
-                                                    "padding": "10px 28px",
-                                                    "fontSize": "14px",
-                                                    "backgroundColor": COLORS["btn_danger"],
-                                                    "color": COLORS["text_primary"],
-                                                    "border": f"1px solid {COLORS['btn_danger_border']}",
-                                                },
-                                            ),
-                                        ],
-                                    ),
-                                ],
+                            html.Summary(
+                                "Columns",
+                                title="Show/hide blotter columns",
+                                className="btn btn-neutral",
+                                style={"padding": "4px 12px", "fontSize": "11px"},
+                            ),
+                            dcc.Checklist(
+                                id="column-checklist",
+                                options=_COLUMN_CHECKLIST_OPTIONS,
+                                value=_DEFAULT_VISIBLE,
+                                style=_COLUMN_CHECKLIST_STYLE,
+                                inputStyle={"marginRight": "5px"},
                             ),
                         ],
                     ),
                 ],
             ),
-            # The blotter DataTable
-            dash_table.DataTable(
-                id="blotter-table",
-                columns=visible_cols,
-                data=initial_data or [],
-                dropdown={
-                    "side": {
-                        "options": [
-                            {"label": "Bid", "value": "Bid"},
-                            {"label": "Offered", "value": "Offered"},
-                        ],
-                    },
-                    "traded": {
-                        "options": [
-                            {"label": "Yes", "value": "Yes"},
-                            {"label": "No", "value": "No"},
-                        ],
-                    },
-                    "bought_sold": {
-                        "options": [
-                            {"label": "Bought", "value": "Bought"},
-                            {"label": "Sold", "value": "Sold"},
-                            {"label": "-", "value": ""},
-                        ],
-                    },
-                },
-                sort_action="native",
-                sort_by=[{"column_id": "added_time", "direction": "desc"}],
-                css=_TABLE_DROPDOWN_CSS,
-                style_table={
-                    "overflowX": "auto",
-                    "overflowY": "visible",
-                    "borderRadius": "10px",
-                    "border": f"1px solid {COLORS['border']}",
-                },
-                style_cell={
-                    "textAlign": "center",
-                    "padding": "10px 14px",
-                    "fontFamily": _FONT_MONO,
-                    "fontSize": "13px",
-                    "cursor": "pointer",
-                    "border": "none",
-                    "overflow": "visible",
-                    "whiteSpace": "normal",
-                    "minWidth": "60px",
-                },
-                style_header={
-                    "backgroundColor": COLORS["bg_toolbar"],
-                    "color": COLORS["text_muted"],
-                    "fontFamily": _FONT_SANS,
-                    "fontWeight": "600",
-                    "fontSize": "11px",
-                    "letterSpacing": "0.05em",
-                    "textTransform": "uppercase",
-                    "borderBottom": f"1px solid {COLORS['border_light']}",
-                    "padding": "11px 14px",
-                    "cursor": "default",
-                },
-                style_data={
-                    "backgroundColor": COLORS["bg_input"],
-                    "color": COLORS["text_primary"],
-                    "borderBottom": f"1px solid {COLORS['border']}",
-                },
-                style_cell_conditional=[
-                    # Delete column: narrow, no-sort icon
-                    {
-                        "if": {"column_id": "delete"},
-                        "width": "36px",
-                        "minWidth": "36px",
-                        "maxWidth": "36px",
-                        "padding": "0",
-                        "cursor": "pointer",
-                    },
-                    # Editable columns get lighter background
-                    {
-                        "if": {"column_id": [
-                            "side", "size", "traded", "bought_sold",
-                            "traded_price", "initiator",
-                        ]},
-                        "backgroundColor": COLORS["bg_input_editable"],
-                    },
-                    # Structure column wider to prevent text clipping
-                    {"if": {"column_id": "structure"}, "minWidth": "160px", "whiteSpace": "normal"},
-                ],
-                style_data_conditional=[
-                    # Bid/Offered coloring
-                    {
-                        "if": {
-                            "filter_query": '{side} = "Bid"',
-                            "column_id": "side",
-                        },
-                        "color": COLORS["positive"],
-                        "fontWeight": "600",
-                    },
-                    {
-                        "if": {
-                            "filter_query": '{side} = "Offered"',
-                            "column_id": "side",
-                        },
-                        "color": COLORS["negative"],
-                        "fontWeight": "600",
-                    },
-                    # Bought/Sold coloring
-                    {
-                        "if": {
-                            "filter_query": '{bought_sold} = "Bought"',
-                            "column_id": "bought_sold",
-                        },
-                        "color": COLORS["positive"],
-                        "fontWeight": "600",
-                    },
-                    {
-                        "if": {
-                            "filter_query": '{bought_sold} = "Sold"',
-                            "column_id": "bought_sold",
-                        },
-                        "color": COLORS["negative"],
-                        "fontWeight": "600",
-                    },
-                    # PnL coloring
-                    {
-                        "if": {
-                            "filter_query": '{pnl} contains "-"',
-                            "column_id": "pnl",
-                        },
-                        "color": COLORS["negative"],
-                        "fontWeight": "600",
-                    },
-                    {
-                        "if": {
-                            "filter_query": '{pnl} contains "+"',
-                            "column_id": "pnl",
-                        },
-                        "color": COLORS["positive"],
-                        "fontWeight": "600",
-                    },
-                    # Delete column styling
-                    {
-                        "if": {"column_id": "delete"},
-                        "color": COLORS["text_hint"],
-                        "fontSize": "15px",
-                    },
-                    # Active row highlight
-                    {
-                        "if": {"state": "active"},
-                        "backgroundColor": COLORS["bg_active_row"],
-                        "border": f"1px solid {COLORS['border_glow']}",
-                    },
-                ],
+            html.P(
+                "Click a row to recall into pricer. Edit cells directly to update order status.",
+                style=_BLOTTER_HINT_STYLE,
             ),
+            # Store for visible column IDs
+            dcc.Store(id="visible-columns", data=_DEFAULT_VISIBLE),
+            # Store for pending delete order ID
+            dcc.Store(id="pending-delete-id", data=None),
+            # Delete confirmation modal: empty until an order is pending delete,
+            # then _delete_modal_body() is mounted into it clientside
+            html.Div(id="delete-confirm-modal"),
+            # The blotter grid
+            dag.AgGrid(rowData=initial_data or [], **_blotter_grid_props()),
         ],
     )
 
@@ -1364,34 +1559,23 @@ def create_order_blotter(initial_data=None):
 def create_layout():
     """Build the full dashboard layout.
 
-    Called by Dash on each page load (app.layout = create_layout) so that
-    persisted orders are loaded from SQLite on refresh.
+    The layout carries no orders: the blotter grid starts empty and a
+    page-load callback fills it (and order-store) from /api/orders, so the
+    first paint never waits on SQLite.
     """
-    # Load persisted orders from SQLite
-    orders = load_orders()
-    blotter_data = _to_blotter_rows(orders)
-
     return html.Div(
-        style={
-            "fontFamily": _FONT_SANS,
-            "backgroundColor": COLORS["bg_page"],
-            "color": COLORS["text_primary"],
-            "minHeight": "100vh",
-            "padding": "24px 28px 80px 28px",
-            "width": "100%",
-            "boxSizing": "border-box",
-        },
+        style=_PAGE_STYLE,
         children=[
-            # Load web fonts
-            _google_fonts_link(),
             # Username modal (blocking overlay until name entered)
             create_username_modal(),
             # Session data stores
+            dcc.Store(id="page-load", data=1),  # fires one-shot setup callbacks
             dcc.Store(id="current-structure", data=None),
-            dcc.Store(id="order-store", data=orders),
+            dcc.Store(id="pricer-snapshot", data=None),
+            dcc.Store(id="order-store", storage_type="memory"),
             dcc.Store(id="suppress-template", data=False),
             dcc.Store(id="auto-price-suppress", data=False),
-            dcc.Store(id="blotter-edit-suppress", data=False),
+            dcc.Store(id="auto-price-sig", data=None),
             # Multi-user stores
             dcc.Store(id="current-user", storage_type="session", data=""),
             dcc.Store(id="ws-blotter-refresh", data=0),
@@ -1404,30 +1588,21 @@ def create_layout():
             dcc.Store(id="market-data-source", data="fallback"),
             dcc.Store(id="fetch-trigger", data=0),
             dcc.Store(id="pricing-context", data=None),
-            # Fallback polling interval for blotter sync (every 5s)
+            # Bridge status check (every 5s, clientside only)
             dcc.Interval(id="blotter-poll", interval=5000, n_intervals=0),
+            # Fallback blotter resync; normal refreshes arrive via ws-blotter-refresh
+            dcc.Interval(id="blotter-resync", interval=BLOTTER_RESYNC_MS, n_intervals=0),
             create_header(),
             # Bloomberg settings panel (collapsible, below header)
             create_bbg_settings_panel(),
             # Subtle divider
-            html.Div(
-                style={
-                    "height": "1px",
-                    "background": f"linear-gradient(90deg, transparent, {COLORS['border_light']}, transparent)",
-                    "margin": "0 0 20px 0",
-                },
-            ),
+            html.Div(className="divider", style=_DIVIDER_TOP_STYLE),
             # Bridge disconnected banner
             create_bridge_banner(),
             create_order_input(),
             # Toolbar + table grouped as one card
             html.Div(
-                style={
-                    "backgroundColor": COLORS["bg_input"],
-                    "borderRadius": "10px",
-                    "border": f"1px solid {COLORS['border']}",
-                    "overflow": "visible",
-                },
+                style=_PRICER_CARD_STYLE,
                 children=[
                     create_pricer_toolbar(),
                     create_pricing_table(),
@@ -1437,13 +1612,7 @@ def create_layout():
             create_broker_quote(),
             create_order_input_section(),
             # Subtle divider
-            html.Div(
-                style={
-                    "height": "1px",
-                    "background": f"linear-gradient(90deg, transparent, {COLORS['border_light']}, transparent)",
-                    "margin": "24px 0 0 0",
-                },
-            ),
-            create_order_blotter(initial_data=blotter_data),
+            html.Div(className="divider", style=_DIVIDER_BLOTTER_STYLE),
+            create_order_blotter(),
         ],
     )
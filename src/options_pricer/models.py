@@ -4,6 +4,10 @@ from dataclasses import dataclass, field
 from datetime import date
 from enum import Enum
 
+import numpy as np
+
+from ._kernels import payoff_grid
+
 
 class OptionType(Enum):
     CALL = "call"
@@ -20,7 +24,7 @@ class QuoteSide(Enum):
     OFFER = "offer"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OptionLeg:
     """A single option leg within a structure."""
 
@@ -31,19 +35,25 @@ class OptionLeg:
     side: Side
     quantity: int = 1
     ratio: int = 1
+    # Enum comparisons resolved once: +1/-1 for buy/sell, +1.0/-1.0 call/put
+    _sign: int = field(init=False, repr=False, compare=False)
+    _cp: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Frozen: set the derived fields past the dataclass __setattr__ guard
+        object.__setattr__(self, "_sign", 1 if self.side == Side.BUY else -1)
+        object.__setattr__(
+            self, "_cp", 1.0 if self.option_type == OptionType.CALL else -1.0
+        )
 
     @property
     def direction(self) -> int:
         """Return +1 for buy, -1 for sell."""
-        return 1 if self.side == Side.BUY else -1
+        return self._sign
 
     def payoff(self, spot: float) -> float:
         """Calculate per-unit payoff at expiration for a given spot price."""
-        if self.option_type == OptionType.CALL:
-            intrinsic = max(spot - self.strike, 0.0)
-        else:
-            intrinsic = max(self.strike - spot, 0.0)
-        return self.direction * self.quantity * intrinsic
+        return self._sign * self.quantity * max(self._cp * (spot - self.strike), 0.0)
 
 
 @dataclass
@@ -53,31 +63,94 @@ class OptionStructure:
     name: str
     legs: list[OptionLeg] = field(default_factory=list)
     description: str = ""
+    # (legs list, leg count, {name: value}) -- see _leg_cache()
+    _cache: tuple | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def add_leg(self, leg: OptionLeg) -> None:
+        """Append a leg, dropping the cached per-leg values."""
+        self.legs.append(leg)
+        self._invalidate()
+
+    def remove_leg(self, leg: OptionLeg) -> None:
+        """Remove a leg, dropping the cached per-leg values."""
+        self.legs.remove(leg)
+        self._invalidate()
+
+    def _invalidate(self) -> None:
+        self._cache = None
+
+    def _leg_cache(self) -> dict:
+        """Memo dict for values derived from the legs.
+
+        Reset if ``legs`` is reassigned or changes length; use
+        add_leg/remove_leg for other in-place edits.
+        """
+        legs = self.legs
+        cache = self._cache
+        if cache is None or cache[0] is not legs or cache[1] != len(legs):
+            cache = self._cache = (legs, len(legs), {})
+        return cache[2]
+
+    def _soa(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return the legs as (strikes, signs, is_call) arrays, built once.
+
+        signs is direction * quantity.
+        """
+        memo = self._leg_cache()
+        soa = memo.get("soa")
+        if soa is None:
+            legs = self.legs
+            n = len(legs)
+            strikes = np.fromiter((leg.strike for leg in legs), np.float64, n)
+            signs = np.fromiter(
+                (leg.direction * leg.quantity for leg in legs), np.float64, n
+            )
+            is_call = np.fromiter(
+                (leg.option_type == OptionType.CALL for leg in legs), bool, n
+            )
+            soa = memo["soa"] = (strikes, signs, is_call)
+        return soa
 
     def total_payoff(self, spot: float) -> float:
         """Calculate total structure payoff at a given spot price."""
         return sum(leg.payoff(spot) for leg in self.legs)
 
+    def payoff_curve(
+        self, spot_low: float, spot_high: float, steps: int = 200
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Return (spots, payoffs) arrays over steps + 1 evenly spaced spots."""
+        spots = np.linspace(spot_low, spot_high, steps + 1)
+        return spots, payoff_grid(spots, *self._soa(), np.empty_like(spots))
+
     def payoff_range(
         self, spot_low: float, spot_high: float, steps: int = 200
     ) -> list[tuple[float, float]]:
-        """Calculate payoff across a range of spot prices."""
-        step_size = (spot_high - spot_low) / steps
-        return [
-            (spot_low + i * step_size, self.total_payoff(spot_low + i * step_size))
-            for i in range(steps + 1)
-        ]
+        """Calculate payoff across a range of spot prices.
+
+        Returns (spot, payoff) tuples; new code (charts in particular) should
+        take the float64 arrays from payoff_curve directly.
+        """
+        spots, total = self.payoff_curve(spot_low, spot_high, steps)
+        return list(zip(spots.tolist(), total.tolist()))
 
     @property
     def net_quantity(self) -> int:
-        return sum(leg.direction * leg.quantity for leg in self.legs)
+        memo = self._leg_cache()
+        if "net_quantity" not in memo:
+            memo["net_quantity"] = sum(leg.direction * leg.quantity for leg in self.legs)
+        return memo["net_quantity"]
 
     @property
-    def underlyings(self) -> set[str]:
-        return {leg.underlying for leg in self.legs}
+    def underlyings(self) -> frozenset[str]:
+        memo = self._leg_cache()
+        if "underlyings" not in memo:
+            memo["underlyings"] = frozenset(leg.underlying for leg in self.legs)
+        return memo["underlyings"]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ParsedOrder:
     """A fully parsed IDB broker order with all metadata."""
 
@@ -91,7 +164,7 @@ class ParsedOrder:
     raw_text: str = ""
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LegMarketData:
     """Market data for a single option leg from screen."""
 
@@ -99,15 +172,18 @@ class LegMarketData:
     bid_size: int = 0
     offer: float = 0.0
     offer_size: int = 0
+    # Derived once at construction (the instance is frozen)
+    mid: float = field(init=False, compare=False)
 
-    @property
-    def mid(self) -> float:
+    def __post_init__(self):
         if self.bid > 0 and self.offer > 0:
-            return (self.bid + self.offer) / 2.0
-        return self.bid or self.offer
+            mid = (self.bid + self.offer) / 2.0
+        else:
+            mid = self.bid or self.offer
+        object.__setattr__(self, "mid", mid)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StructureMarketData:
     """Full market pricing for a structure."""
 
@@ -119,10 +195,13 @@ class StructureMarketData:
     structure_offer: float = 0.0
     structure_bid_size: int = 0
     structure_offer_size: int = 0
+    # Derived once at construction (the instance is frozen)
+    structure_mid: float = field(init=False, compare=False)
 
-    @property
-    def structure_mid(self) -> float:
-        return (self.structure_bid + self.structure_offer) / 2.0
+    def __post_init__(self):
+        object.__setattr__(
+            self, "structure_mid", (self.structure_bid + self.structure_offer) / 2.0
+        )
 
 
 @dataclass
@@ -10,6 +10,8 @@ Migrates automatically from the legacy orders.json file on first use.
 import json
 import logging
 import sqlite3
+import threading
+import time
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -79,8 +81,11 @@ def _ensure_db(db_path: Path | None = None) -> None:
         _migrate_from_json(db_path)
 
 
-def load_orders(db_path: Path | None = None) -> list[dict]:
-    """Load all orders from SQLite. Returns [] if DB is missing or corrupt."""
+def load_order_rows(db_path: Path | None = None) -> list[str]:
+    """Load the stored JSON text of every order, oldest first, without decoding.
+
+    Cheap enough to use as a change check. Returns [] if DB is missing or corrupt.
+    """
     _ensure_db(db_path)
     try:
         conn = _get_db(db_path)
@@ -88,7 +93,7 @@ def load_orders(db_path: Path | None = None) -> list[dict]:
             rows = conn.execute(
                 "SELECT data FROM orders ORDER BY created_at ASC"
             ).fetchall()
-            return [json.loads(row[0]) for row in rows]
+            return [row[0] for row in rows]
         finally:
             conn.close()
     except Exception:
@@ -96,6 +101,11 @@ def load_orders(db_path: Path | None = None) -> list[dict]:
         return []
 
 
+def load_orders(db_path: Path | None = None) -> list[dict]:
+    """Load all orders from SQLite. Returns [] if DB is missing or corrupt."""
+    return [json.loads(data) for data in load_order_rows(db_path)]
+
+
 def save_orders(orders: list[dict], db_path: Path | None = None) -> None:
     """Replace all orders in SQLite (full sync from in-memory state)."""
     _ensure_db(db_path)
@@ -166,3 +176,100 @@ def update_order(order_id: str, updates: dict, db_path: Path | None = None) -> l
         raise
     finally:
         conn.close()
+
+
+class DebouncedOrderSaver:
+    """Single background writer that coalesces bursts of saves.
+
+    Callers hand over the latest full order list and return immediately.
+    The worker waits up to `delay` seconds so a burst of edits collapses into
+    one write, then persists only the newest snapshot. A flush() cuts the
+    wait short, so readers never sit out the debounce.
+    """
+
+    def __init__(self, delay: float = 0.2, save=None, load=None):
+        self.delay = delay
+        self._save = save or save_orders
+        self._load = load or load_orders
+        self._pending: list[dict] | None = None
+        self._inflight: list[dict] | None = None
+        self._flushers = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None
+
+    def submit(self, orders: list[dict]) -> None:
+        """Queue `orders` as the next snapshot to write."""
+        with self._cond:
+            self._pending = orders
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="order-saver", daemon=True,
+                )
+                self._thread.start()
+            self._cond.notify_all()
+
+    def update(self, mutate) -> list[dict] | None:
+        """Apply `mutate` to the newest order list and queue the result.
+
+        The newest list is the pending snapshot, else the one being written,
+        else what is on disk. `mutate` gets a copy whose order dicts it may
+        edit in place, and returns whether it changed anything. Runs under
+        the saver's lock, so concurrent callbacks resolve orders by id
+        against the same list and never overwrite each other's changes.
+
+        Returns the updated list, or None if `mutate` changed nothing.
+        """
+        with self._cond:
+            base = self._pending if self._pending is not None else self._inflight
+            if base is None:
+                base = self._load()
+            orders = [dict(o) for o in base]
+            if not mutate(orders):
+                return None
+            self.submit(orders)
+        return orders
+
+    def flush(self) -> None:
+        """Block until any submitted snapshot has been written."""
+        with self._cond:
+            self._flushers += 1
+            self._cond.notify_all()
+            try:
+                while self._pending is not None or self._inflight is not None:
+                    self._cond.wait()
+            finally:
+                self._flushers -= 1
+
+    def close(self) -> None:
+        """Write any pending snapshot and stop the worker thread."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while self._pending is None and not self._closed:
+                    self._cond.wait()
+                if self._pending is None:
+                    return
+                deadline = time.monotonic() + self.delay
+                while not (self._flushers or self._closed):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(timeout=remaining)
+                orders, self._pending = self._pending, None
+                self._inflight = orders
+            try:
+                self._save(orders)
+            except Exception:
+                logger.warning("Background order save failed", exc_info=True)
+            finally:
+                with self._cond:
+                    self._inflight = None
+                    self._cond.notify_all()
@@ -13,6 +13,11 @@ DEFAULT_DIVIDEND_YIELD = 0.0
 DASHBOARD_HOST = "127.0.0.1"
 DASHBOARD_PORT = 8050
 DASHBOARD_DEBUG = True
+# Order blotter rows rendered per page (the table pages natively in the browser)
+BLOTTER_PAGE_SIZE = 50
+# Blotter changes are pushed over the WebSocket; this slow poll only covers
+# missed pushes (reconnects, socket unavailable)
+BLOTTER_RESYNC_MS = 30_000
 
 # Multi-user settings
 MAX_USERS = 15
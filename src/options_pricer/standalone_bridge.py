@@ -77,6 +77,7 @@ class BloombergClient:
         self._host = host
         self._port = port
         self._session = None
+        self._multipliers = {}  # OPT_CONT_SIZE is static — fetch once
 
     def connect(self):
         try:
@@ -150,9 +151,61 @@ class BloombergClient:
             logger.warning("Failed to fetch option quote for %s", underlying)
             return OptionQuote()
 
+    def get_structure_quotes(self, underlying, legs):
+        """Spot, per-leg quotes and multiplier in one ReferenceDataRequest."""
+        if not self._session:
+            return None, [OptionQuote() for _ in legs], 100
+        equity = f"{underlying} US Equity"
+        tickers = [
+            f"{underlying} {exp.strftime('%m/%d/%y')} {'C' if ot == 'call' else 'P'}{k:.0f} Equity"
+            for exp, k, ot in legs
+        ]
+        spot, mult, by_ticker = None, self._multipliers.get(underlying, 100), {}
+        try:
+            import blpapi
+            refdata = self._session.getService("//blp/refdata")
+            req = refdata.createRequest("ReferenceDataRequest")
+            for sec in dict.fromkeys([equity] + tickers):
+                req.append("securities", sec)
+            for f in ("PX_LAST", "OPT_CONT_SIZE", "BID", "ASK", "BID_SIZE", "ASK_SIZE"):
+                req.append("fields", f)
+            self._session.sendRequest(req)
+            while True:
+                ev = self._session.nextEvent(500)
+                for msg in ev:
+                    if not msg.hasElement("securityData"):
+                        continue
+                    arr = msg.getElement("securityData")
+                    for j in range(arr.numValues()):
+                        sd = arr.getValueAsElement(j)
+                        sec = sd.getElementAsString("security")
+                        fd = sd.getElement("fieldData")
+                        if sec == equity:
+                            if fd.hasElement("PX_LAST"): spot = fd.getElementAsFloat("PX_LAST")
+                            if fd.hasElement("OPT_CONT_SIZE"):
+                                mult = self._multipliers[underlying] = int(fd.getElementAsFloat("OPT_CONT_SIZE"))
+                            continue
+                        q = OptionQuote()
+                        try: q.bid = fd.getElementAsFloat("BID")
+                        except Exception: pass
+                        try: q.offer = fd.getElementAsFloat("ASK")
+                        except Exception: pass
+                        try: q.bid_size = int(fd.getElementAsFloat("BID_SIZE"))
+                        except Exception: pass
+                        try: q.offer_size = int(fd.getElementAsFloat("ASK_SIZE"))
+                        except Exception: pass
+                        by_ticker[sec] = q
+                if ev.eventType() == blpapi.Event.RESPONSE:
+                    break
+        except Exception:
+            logger.warning("Failed to fetch structure quotes for %s", underlying)
+        return spot, [by_ticker.get(t) or OptionQuote() for t in tickers], mult
+
     def get_contract_multiplier(self, underlying):
         if not self._session:
             return 100
+        if underlying in self._multipliers:
+            return self._multipliers[underlying]
         try:
             import blpapi
             refdata = self._session.getService("//blp/refdata")
@@ -165,7 +218,8 @@ class BloombergClient:
                 for msg in ev:
                     if msg.hasElement("securityData"):
                         fd = msg.getElement("securityData").getValueAsElement(0).getElement("fieldData")
-                        return int(fd.getElementAsFloat("OPT_CONT_SIZE"))
+                        mult = self._multipliers[underlying] = int(fd.getElementAsFloat("OPT_CONT_SIZE"))
+                        return mult
                 if ev.eventType() == blpapi.Event.RESPONSE:
                     break
         except Exception:
@@ -224,6 +278,10 @@ class MockBloombergClient:
     def get_contract_multiplier(self, underlying):
         return 100
 
+    def get_structure_quotes(self, underlying, legs):
+        quotes = [self.get_option_quote(underlying, *leg) for leg in legs]
+        return self.get_spot(underlying), quotes, self.get_contract_multiplier(underlying)
+
 
 def _norm_cdf(x):
     """Standard normal CDF (no scipy dependency)."""
@@ -282,22 +340,29 @@ def api_option_quotes():
         return jsonify({"error": "Missing 'underlying' and 'legs'"}), 400
 
     underlying = data["underlying"].upper()
-    spot = _client.get_spot(underlying)
-    quotes = []
+    batch_legs, batch_index = [], []
     for leg in data["legs"]:
         try:
             expiry = datetime.strptime(leg.get("expiry", ""), "%Y-%m-%d").date()
         except (ValueError, TypeError):
+            batch_index.append(None)
+            continue
+        batch_index.append(len(batch_legs))
+        batch_legs.append((expiry, float(leg.get("strike", 0)),
+                           leg.get("option_type", "call")))
+
+    # One Bloomberg round-trip for spot + all legs + multiplier
+    spot, batch_quotes, mult = _client.get_structure_quotes(underlying, batch_legs)
+    quotes = []
+    for idx in batch_index:
+        if idx is None:
             quotes.append({"bid": 0, "bid_size": 0, "offer": 0, "offer_size": 0})
             continue
-        q = _client.get_option_quote(underlying, expiry,
-                                      float(leg.get("strike", 0)),
-                                      leg.get("option_type", "call"))
+        q = batch_quotes[idx]
         quotes.append({"bid": q.bid, "bid_size": q.bid_size,
                         "offer": q.offer, "offer_size": q.offer_size})
 
-    return jsonify({"spot": spot, "quotes": quotes,
-                     "multiplier": _client.get_contract_multiplier(underlying)})
+    return jsonify({"spot": spot, "quotes": quotes, "multiplier": mult})
 
 # ---------------------------------------------------------------------------
 # Main
@@ -132,6 +132,26 @@ class TestOptionQuotesEndpoint:
         assert q["bid"] == 0
         assert q["offer"] == 0
 
+    def test_option_quotes_bad_expiry_keeps_leg_order(self, client):
+        payload = {
+            "underlying": "AAPL",
+            "legs": [
+                {"expiry": "2026-06-19", "strike": 240.0, "option_type": "put"},
+                {"expiry": "not-a-date", "strike": 250.0, "option_type": "call"},
+                {"expiry": "2026-06-19", "strike": 260.0, "option_type": "call"},
+            ],
+        }
+        resp = client.post(
+            "/api/option_quotes",
+            data=json.dumps(payload),
+            content_type="application/json",
+        )
+        quotes = resp.get_json()["quotes"]
+        assert len(quotes) == 3
+        assert quotes[0]["bid"] > 0
+        assert quotes[1]["bid"] == 0
+        assert quotes[2]["bid"] > 0
+
     def test_cors_headers(self, client):
         resp = client.get("/api/status")
         # flask-cors adds these headers
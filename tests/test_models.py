@@ -1,7 +1,12 @@
 """Tests for data models."""
 
+import dataclasses
 from datetime import date
 
+import numpy as np
+import pytest
+
+from options_pricer._kernels import _payoff_grid_loops, _payoff_grid_numpy
 from options_pricer.models import OptionLeg, OptionStructure, OptionType, Side
 
 
@@ -53,6 +58,14 @@ class TestOptionLeg:
         leg = OptionLeg("AAPL", date(2025, 1, 16), 150.0, OptionType.CALL, Side.BUY, 10)
         assert leg.payoff(160.0) == 100.0
 
+    def test_leg_is_frozen_and_hashable(self):
+        leg = OptionLeg("AAPL", date(2025, 1, 16), 150.0, OptionType.CALL, Side.BUY)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            leg.side = Side.SELL
+        flipped = dataclasses.replace(leg, side=Side.SELL)
+        assert flipped.direction == -1
+        assert hash(leg) == hash(dataclasses.replace(flipped, side=Side.BUY))
+
 
 class TestOptionStructure:
     def _make_call_spread(self):
@@ -108,3 +121,35 @@ class TestOptionStructure:
         assert len(points) == 4
         assert points[0] == (140.0, 0.0)
         assert points[-1] == (170.0, 10.0)
+
+    def test_payoff_curve_matches_total_payoff(self):
+        s = self._make_call_spread()
+        spots, payoffs = s.payoff_curve(140.0, 170.0, steps=30)
+        assert len(spots) == len(payoffs) == 31
+        for spot, payoff in zip(spots, payoffs):
+            assert payoff == s.total_payoff(float(spot))
+
+    def test_add_leg_refreshes_payoff_curve(self):
+        s = self._make_call_spread()
+        s.payoff_curve(140.0, 170.0, steps=3)
+        s.add_leg(OptionLeg("AAPL", date(2025, 1, 16), 170.0, OptionType.CALL, Side.SELL, 1))
+        _, payoffs = s.payoff_curve(160.0, 180.0, steps=2)
+        assert payoffs.tolist() == [10.0, 10.0, 0.0]
+
+    def test_payoff_grid_kernels_agree(self):
+        s = self._make_call_spread()
+        s.add_leg(OptionLeg("AAPL", date(2025, 1, 16), 155.0, OptionType.PUT, Side.BUY, 2))
+        spots = np.linspace(130.0, 180.0, 51)
+        args = (spots, *s._soa())
+        fused = _payoff_grid_loops(*args, np.empty_like(spots))
+        vectorized = _payoff_grid_numpy(*args, np.empty_like(spots))
+        assert np.allclose(fused, vectorized)
+
+    def test_remove_leg_refreshes_cached_properties(self):
+        s = self._make_call_spread()
+        assert s.net_quantity == 0
+        s.remove_leg(s.legs[1])
+        assert s.net_quantity == 1
+        s.legs = [OptionLeg("MSFT", date(2025, 1, 16), 400.0, OptionType.PUT, Side.SELL, 3)]
+        assert s.underlyings == {"MSFT"}
+        assert s.net_quantity == -3
@@ -1,10 +1,19 @@
 """Tests for the order store SQLite persistence layer."""
 
+import json
+import threading
 from pathlib import Path
 
 import pytest
 
-from options_pricer.order_store import add_order, load_orders, save_orders, update_order
+from options_pricer.order_store import (
+    DebouncedOrderSaver,
+    add_order,
+    load_order_rows,
+    load_orders,
+    save_orders,
+    update_order,
+)
 
 
 class TestLoadOrders:
@@ -24,6 +33,14 @@ class TestLoadOrders:
         assert len(result) == 1
         assert result[0]["underlying"] == "AAPL"
 
+    def test_load_order_rows_returns_raw_json(self, tmp_path):
+        fp = tmp_path / "orders.db"
+        save_orders([{"id": "abc", "underlying": "AAPL"}], fp)
+        rows = load_order_rows(fp)
+        assert len(rows) == 1
+        assert isinstance(rows[0], str)
+        assert json.loads(rows[0])["underlying"] == "AAPL"
+
 
 class TestSaveOrders:
     def test_creates_db(self, tmp_path):
@@ -95,3 +112,76 @@ class TestCreatedBy:
         add_order({"id": "1", "underlying": "AAPL", "created_by": "bob"}, fp)
         loaded = load_orders(fp)
         assert loaded[0]["created_by"] == "bob"
+
+
+class TestDebouncedOrderSaver:
+    def test_flush_writes_newest_snapshot_once(self):
+        saved = []
+        # Long debounce: only flush() can trigger the write
+        saver = DebouncedOrderSaver(delay=60, save=saved.append)
+        try:
+            for i in range(3):
+                saver.submit([{"id": str(i)}])
+            saver.flush()
+            assert saved == [[{"id": "2"}]]
+        finally:
+            saver.close()
+
+    def test_writes_after_debounce_without_flush(self):
+        saved = []
+        written = threading.Event()
+
+        def save(orders):
+            saved.append(orders)
+            written.set()
+
+        saver = DebouncedOrderSaver(delay=0.01, save=save)
+        try:
+            saver.submit([{"id": "1"}])
+            assert written.wait(timeout=10)
+            assert saved == [[{"id": "1"}]]
+        finally:
+            saver.close()
+
+    def test_flush_with_nothing_pending_returns(self):
+        saved = []
+        saver = DebouncedOrderSaver(save=saved.append)
+        saver.flush()
+        saver.close()
+        assert saved == []
+
+    def test_update_applies_to_newest_snapshot(self):
+        saved = []
+        saver = DebouncedOrderSaver(delay=60, save=saved.append, load=lambda: [])
+        try:
+            saver.update(lambda orders: orders.append({"id": "1"}) or True)
+            saver.update(lambda orders: orders.append({"id": "2"}) or True)
+
+            def edit(orders):
+                for order in orders:
+                    if order["id"] == "1":
+                        order["traded"] = "Yes"
+                return True
+
+            result = saver.update(edit)
+            assert result == [{"id": "1", "traded": "Yes"}, {"id": "2"}]
+            saver.flush()
+            assert saved == [result]
+        finally:
+            saver.close()
+
+    def test_update_without_change_submits_nothing(self):
+        saved = []
+        saver = DebouncedOrderSaver(save=saved.append, load=lambda: [{"id": "1"}])
+        assert saver.update(lambda orders: False) is None
+        saver.flush()
+        saver.close()
+        assert saved == []
+
+    def test_close_writes_pending_and_stops_worker(self, tmp_path):
+        fp = tmp_path / "orders.db"
+        saver = DebouncedOrderSaver(delay=60, save=lambda o: save_orders(o, fp))
+        saver.submit([{"id": "1", "underlying": "AAPL"}])
+        saver.close()
+        assert load_orders(fp)[0]["underlying"] == "AAPL"
+        assert not saver._thread.is_alive()